@@ -0,0 +1,6 @@
+from django.urls import path
+from .async_views import AsyncMeView
+
+urlpatterns = [
+    path("me/", AsyncMeView.as_view(), name="async-me"),
+]
@@ -0,0 +1,11 @@
+from book_explorer.async_api import AsyncAPIView
+
+from .serializers import UserSerializer
+
+
+class AsyncMeView(AsyncAPIView):
+    """Get current user details (async-native counterpart of MeView)"""
+    authentication_required = True
+
+    async def get(self, request):
+        return self.respond(UserSerializer(self.api_request.user).data)
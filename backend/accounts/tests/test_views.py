@@ -2,6 +2,7 @@ import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 
 User = get_user_model()
 
@@ -141,3 +142,31 @@ class TestTokenRefreshView:
             format='json'
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def bearer(user):
+    """Authorization header with an access token for the user"""
+    return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+
+class TestAsyncMeView:
+    """Tests for the async-native current user endpoint"""
+
+    def test_requires_authentication(self, api_client):
+        """Anonymous requests get the API's 401 error"""
+        response = api_client.get('/api/async/auth/me/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.json()['error']['status_code'] == 401
+        assert response['WWW-Authenticate'].startswith('Bearer')
+
+    def test_rejects_invalid_token(self, api_client):
+        """A malformed token is rejected"""
+        response = api_client.get('/api/async/auth/me/', HTTP_AUTHORIZATION='Bearer not-a-token')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_matches_sync_view(self, api_client, user):
+        """The async view returns the same payload as MeView"""
+        sync = api_client.get('/api/auth/me/', **bearer(user))
+        response = api_client.get('/api/async/auth/me/', **bearer(user))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == sync.json()
@@ -0,0 +1,49 @@
+"""
+Micro-benchmarks for the backend hot paths.
+
+Each module is runnable on its own from the backend directory, e.g.
+
+    python -m benchmarks.bench_serialization
+
+and prints its timings; none of them are collected by pytest.
+"""
+import os
+import statistics
+import time
+
+
+def setup_django(database=None):
+    """
+    Configure Django for a standalone benchmark run. With `database` (a
+    SQLite file path), the default database is pointed at it and migrated,
+    so benchmarks never touch the development database.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'book_explorer.settings')
+    os.environ.setdefault('SECRET_KEY', 'benchmark-only-secret-key')
+
+    import django
+    from django.conf import settings
+
+    if database is not None:
+        settings.DATABASES['default']['NAME'] = str(database)
+    django.setup()
+
+    if database is not None:
+        from django.core.management import call_command
+
+        call_command('migrate', verbosity=0)
+
+
+def timeit(func, repeat=5, number=100):
+    """Return the median seconds per call of `func` over `repeat` runs."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - start) / number)
+    return statistics.median(runs)
+
+
+def report(name, seconds):
+    print(f'{name:<50} {seconds * 1000:10.3f} ms')
@@ -0,0 +1,178 @@
+"""
+Throughput of the read endpoints behind WSGI and ASGI, with slow clients.
+
+Both handlers are driven in-process, without a network server:
+
+- wsgi:       the DRF views on the WSGI handler, served by a fixed pool of
+              worker threads (like gunicorn --threads).
+- asgi-sync:  the same DRF views on the ASGI handler, where Django runs
+              each sync view in a thread.
+- asgi-async: the /api/async/ views on the ASGI handler, in one event loop.
+
+A slow client is simulated by delaying the consumption of every response
+body by --client-delay seconds. A WSGI worker thread is blocked for that
+time, while the event loop serves other requests meanwhile. Note that on
+Django 4.2 the async ORM still runs queries in one shared sync thread, so
+with --client-delay 0 (CPU/database bound) ASGI is not faster than WSGI;
+the gain is in how many slow requests one process keeps in flight.
+
+    python -m benchmarks.bench_asgi --books 5000 --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks import setup_django
+
+PATHS = [
+    ('list', '/api/books/', ''),
+    ('list', '/api/books/', 'genre=fiction&ordering=-published_year'),
+    ('list', '/api/books/', 'search=shadow&page_size=24'),
+    ('list', '/api/books/', 'page=3&ordering=author'),
+    ('detail', '/api/books/{id}/', ''),
+    ('choices', '/api/books/choices/', ''),
+]
+
+
+def request_mix(count, book_ids, async_prefix=False, seed=1):
+    rng = random.Random(seed)
+    for _ in range(count):
+        name, path, query = rng.choice(PATHS)
+        path = path.format(id=rng.choice(book_ids))
+        if async_prefix:
+            path = path.replace('/api/', '/api/async/', 1)
+        yield name, path, query
+
+
+def wsgi_environ(path, query):
+    return {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query, 'SCRIPT_NAME': '',
+        'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+        'HTTP_HOST': 'localhost', 'REMOTE_ADDR': '127.0.0.1',
+        'wsgi.version': (1, 0), 'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+    }
+
+
+def run_wsgi(app, requests, threads, client_delay):
+    def call(request):
+        name, path, query = request
+        started = time.perf_counter()
+        statuses = []
+        body = app(wsgi_environ(path, query), lambda status, headers, exc_info=None: statuses.append(status))
+        try:
+            for _ in body:
+                if client_delay:
+                    time.sleep(client_delay)
+        finally:
+            body.close()
+        return name, statuses[0].split()[0], time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(call, requests))
+
+
+async def run_asgi(app, requests, concurrency, client_delay):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(request):
+        name, path, query = request
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+            'path': path, 'raw_path': path.encode(), 'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'host', b'localhost')], 'client': ('127.0.0.1', 50000), 'server': ('localhost', 80),
+        }
+        received = False
+        status = None
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await asyncio.Event().wait()  # the client never disconnects
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            elif message['type'] == 'http.response.body' and client_delay:
+                await asyncio.sleep(client_delay)
+
+        async with semaphore:
+            started = time.perf_counter()
+            await app(scope, receive, send)
+            return name, str(status), time.perf_counter() - started
+
+    return await asyncio.gather(*(call(request) for request in requests))
+
+
+def summarize(mode, results, elapsed):
+    by_endpoint = {}
+    for name, _, seconds in results:
+        by_endpoint.setdefault(name, []).append(seconds * 1000)
+    errors = sum(1 for _, status, _ in results if not status.startswith('2'))
+
+    def percentiles(values):
+        values = sorted(values)
+        cuts = statistics.quantiles(values, n=100) if len(values) > 1 else values * 99
+        return {'p50': round(cuts[49], 2), 'p95': round(cuts[94], 2), 'p99': round(cuts[98], 2)}
+
+    return {
+        'mode': mode,
+        'requests': len(results),
+        'errors': errors,
+        'seconds': round(elapsed, 3),
+        'throughput_rps': round(len(results) / elapsed, 1),
+        'latency_ms': {name: percentiles(values) for name, values in sorted(by_endpoint.items())},
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--books', type=int, default=5000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8, help='WSGI worker threads')
+    parser.add_argument('--concurrency', type=int, default=200, help='Requests in flight on the ASGI handler')
+    parser.add_argument('--client-delay', type=float, default=0.25, help='Seconds a client takes to read a response')
+    parser.add_argument('--modes', default='wsgi,asgi-sync,asgi-async')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(Path(directory) / 'bench.sqlite3')
+
+        from django.conf import settings
+        from django.core.asgi import get_asgi_application
+        from django.core.wsgi import get_wsgi_application
+
+        from benchmarks.seed import seed_books
+        from books.models import Book
+
+        # Compare the data paths, not the anonymous list response cache.
+        settings.BOOK_LIST_CACHE_TIMEOUT = 0
+        seed_books(args.books)
+        book_ids = list(Book.objects.values_list('id', flat=True))
+
+        reports = []
+        for mode in args.modes.split(','):
+            requests = list(request_mix(args.requests, book_ids, async_prefix=mode == 'asgi-async'))
+            started = time.perf_counter()
+            if mode == 'wsgi':
+                results = run_wsgi(get_wsgi_application(), requests, args.threads, args.client_delay)
+            else:
+                results = asyncio.run(run_asgi(get_asgi_application(), requests, args.concurrency, args.client_delay))
+            reports.append(summarize(mode, results, time.perf_counter() - started))
+
+    print(json.dumps({'config': vars(args), 'results': reports}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
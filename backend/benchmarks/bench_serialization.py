@@ -0,0 +1,67 @@
+"""
+Serialization cost of one 100-row book list page: BookSerializer over model
+instances versus FastListRepresentation over `.values()` rows.
+
+Rows are built in memory, so only serialization is timed, not the database.
+"""
+from datetime import timedelta
+
+from benchmarks import report, setup_django, timeit
+
+setup_django()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from books.models import Book  # noqa: E402
+from books.serializers import BookSerializer, FastListRepresentation  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def make_rows(count=PAGE_SIZE):
+    now = timezone.now()
+    rows = []
+    for i in range(count):
+        rows.append({
+            'id': i + 1,
+            'title': f'Benchmark title {i}',
+            'author': f'Author {i % 17}',
+            'description': 'A fairly ordinary description. ' * 8,
+            'genre': 'fiction' if i % 2 else 'non_fiction',
+            'book_type': 'novel',
+            'published_year': 1950 + i % 70 if i % 5 else None,
+            'cover_image': f'book_covers/cover-{i}.jpg' if i % 3 else '',
+            'created_at': now - timedelta(days=i),
+            'updated_at': now,
+        })
+    return rows
+
+
+def main():
+    request = APIRequestFactory().get('/api/books/', HTTP_HOST='localhost')
+    context = {'request': request}
+    rows = make_rows()
+    representation = FastListRepresentation(BookSerializer, context)
+    rows = [{source: row[source] for source in representation.sources} for row in rows]
+
+    def serializer():
+        instances = [Book(**row) for row in rows]
+        return BookSerializer(instances, many=True, context=context).data
+
+    def fast():
+        return representation.to_representation(rows)
+
+    assert JSONRenderer().render(serializer()) == JSONRenderer().render(fast())
+
+    print(f'Serialization of one {PAGE_SIZE}-row page (median):')
+    before = timeit(serializer)
+    after = timeit(fast)
+    report('BookSerializer (model instances)', before)
+    report('FastListRepresentation (values() rows)', after)
+    print(f'speedup: {before / after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Fast fixture factories for benchmarks and performance tests.
+
+Rows are generated deterministically from a seed and written with
+bulk_create in large batches, so seeding tens of thousands of books takes
+seconds rather than minutes.
+"""
+import random
+
+from books.models import Book
+from books.signals import catalog_bulk_changed
+
+WORDS = (
+    'shadow garden river winter empire silent glass iron midnight orchard '
+    'harbor lantern crimson forest echo atlas ember hollow tide summer '
+    'kingdom cipher north letters machine ocean paper storm velvet wild'
+).split()
+
+FIRST_NAMES = 'Ada Harlan Mira Tomas Lena Oskar Ines Farah Jonah Priya Kofi Elena'.split()
+LAST_NAMES = 'Coben Okafor Lindqvist Moreau Tanaka Novak Reyes Haddad Brennan Kowalski'.split()
+
+GENRES = [value for value, _ in Book.GENRE_CHOICES]
+BOOK_TYPES = [value for value, _ in Book.BOOK_TYPE_CHOICES]
+
+
+def book_rows(count, seed=0):
+    """Yield `count` unsaved Book instances with varied, realistic values."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))).title()
+        yield Book(
+            title=title,
+            author=f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}',
+            description=' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 60))),
+            genre=rng.choice(GENRES + [None]),
+            book_type=rng.choice(BOOK_TYPES + [None]),
+            published_year=rng.choice([None] + list(range(1900, 2025))),
+        )
+
+
+def seed_books(count, batch_size=5000, seed=0):
+    """Insert `count` books and return how many exist afterwards."""
+    batch = []
+    for book in book_rows(count, seed):
+        batch.append(book)
+        if len(batch) >= batch_size:
+            Book.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Book.objects.bulk_create(batch)
+    catalog_bulk_changed.send(sender=Book)
+    return Book.objects.count()
@@ -0,0 +1,56 @@
+"""
+Base view for the async-native read endpoints served under /api/async/
+(see books.async_views and accounts.async_views).
+
+DRF views are synchronous, so under an ASGI server every request to them
+holds a thread until its response has been sent, slow clients included.
+These are plain Django async views: they reuse the DRF pieces that do no
+I/O (filter backends, serializer fields, exceptions), read the database
+with the async ORM, and return the same JSON and error format as the DRF
+endpoints.
+"""
+import asyncio
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, JsonResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.request import Request
+
+from accounts.authentication import AsyncJWTAuthentication
+
+from .exceptions import custom_exception_handler
+
+
+class AsyncAPIView(View):
+    authentication_class = AsyncJWTAuthentication
+    authentication_required = False
+
+    async def dispatch(self, request, *args, **kwargs):
+        # A DRF request gives serializers and filter backends what they expect.
+        self.api_request = Request(request)
+        try:
+            result = await self.authentication_class().aauthenticate(request)
+            self.api_request.user = result[0] if result else AnonymousUser()
+            if self.authentication_required and not self.api_request.user.is_authenticated:
+                raise exceptions.NotAuthenticated()
+
+            response = super().dispatch(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except (exceptions.APIException, Http404) as exc:
+            response = self.handle_exception(exc)
+        return response
+
+    def respond(self, data, status=200):
+        return JsonResponse(data, status=status, safe=False, json_dumps_params={'ensure_ascii': False})
+
+    def handle_exception(self, exc):
+        """Render exceptions like DRF's APIView would, with the custom error format."""
+        if isinstance(exc, Http404):
+            exc = exceptions.NotFound(*exc.args)
+        drf_response = custom_exception_handler(exc, {'view': self, 'request': self.api_request})
+        response = self.respond(drf_response.data, status=drf_response.status_code)
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            response['WWW-Authenticate'] = self.authentication_class().authenticate_header(self.api_request)
+        return response
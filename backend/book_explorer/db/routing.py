@@ -0,0 +1,82 @@
+"""
+Read replica routing.
+
+Reads and writes go to `default` (the primary) unless a view opts in with
+ReplicaRoutingMixin: its GET requests then read from one of the replicas
+in DATABASE_REPLICAS. After a user successfully writes through any view
+using the mixin, their reads are pinned to the primary for
+DATABASE_REPLICA_PIN_SECONDS, so they see their own changes despite
+replication lag. Pins are stored in the cache, so they hold across
+processes when the cache is shared.
+"""
+import contextvars
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+_read_alias = contextvars.ContextVar('read_alias', default=None)
+
+
+class PrimaryReplicaRouter:
+    """Send reads to the alias chosen for the current request, if any."""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+
+def get_replicas():
+    """
+    Configured replicas that are a different database from the primary
+    (under tests replicas mirror the primary, so none are used).
+    """
+    primary = connections[DEFAULT_DB_ALIAS].settings_dict['NAME']
+    return [alias for alias in settings.DATABASE_REPLICAS if connections[alias].settings_dict['NAME'] != primary]
+
+
+def pin_key(user_id):
+    return f'db:pinned:{user_id}'
+
+
+def pin_to_primary(user):
+    """Pin the user's reads to the primary after a write."""
+    if settings.DATABASE_REPLICA_PIN_SECONDS > 0:
+        cache.set(pin_key(user.pk), True, settings.DATABASE_REPLICA_PIN_SECONDS)
+
+
+def is_pinned_to_primary(user):
+    return user.is_authenticated and bool(cache.get(pin_key(user.pk)))
+
+
+class ReplicaRoutingMixin:
+    """
+    DRF view mixin: GET requests read from a replica when
+    `read_from_replica` is set, and successful writes pin the user to the
+    primary.
+    """
+    read_from_replica = False
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.read_from_replica and request.method in SAFE_METHODS and not is_pinned_to_primary(request.user):
+            replicas = get_replicas()
+            if replicas:
+                self._read_alias_token = _read_alias.set(random.choice(replicas))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_read_alias_token', None)
+        if token is not None:
+            _read_alias.reset(token)
+            self._read_alias_token = None
+        if request.method not in SAFE_METHODS and response.status_code < 400 and request.user.is_authenticated:
+            pin_to_primary(request.user)
+        return super().finalize_response(request, response, *args, **kwargs)
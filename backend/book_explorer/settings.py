@@ -14,6 +14,8 @@ from pathlib import Path
 import os
 from dotenv import load_dotenv
 
+from book_explorer.db.config import REPLICA_PREFIX, databases_from_env
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -101,13 +103,38 @@ WSGI_APPLICATION = 'book_explorer.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+# SQLite (in WAL mode) by default; set DATABASE_URL (and
+# DATABASE_REPLICA_URLS) for PostgreSQL. See book_explorer/db/config.py for the connection options.
+
+DATABASES = databases_from_env(os.environ, BASE_DIR / 'db.sqlite3')
+
+DATABASE_ROUTERS = ['book_explorer.db.routing.PrimaryReplicaRouter']
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith(REPLICA_PREFIX)]
+# Seconds a user's reads stay on the primary after they write.
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get('DATABASE_REPLICA_PIN_SECONDS', '5'))
+
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory by default; set REDIS_URL to share the cache between processes.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'book-explorer',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
     }
-}
 
 
 # Password validation
@@ -151,6 +178,34 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Book list counts: exact below the threshold, otherwise 'cached' (exact count
+# cached per filter set until the catalog changes) or 'estimate' (planner row
+# estimate, PostgreSQL only; falls back to 'cached' elsewhere).
+BOOK_COUNT_EXACT_THRESHOLD = int(os.environ.get('BOOK_COUNT_EXACT_THRESHOLD', '10000'))
+BOOK_COUNT_STRATEGY = os.environ.get('BOOK_COUNT_STRATEGY', 'cached')
+BOOK_COUNT_CACHE_TIMEOUT = int(os.environ.get('BOOK_COUNT_CACHE_TIMEOUT', '300'))
+
+# Seconds an anonymous book list response stays cached. Entries are also
+# invalidated whenever a book is created, updated or deleted.
+BOOK_LIST_CACHE_TIMEOUT = int(os.environ.get('BOOK_LIST_CACHE_TIMEOUT', '60'))
+
+# Maximum number of operations accepted by POST /api/books/bulk/.
+BOOK_BULK_MAX_OPERATIONS = int(os.environ.get('BOOK_BULK_MAX_OPERATIONS', '1000'))
+
+# Rows fetched per database round trip by GET /api/books/export/.
+BOOK_EXPORT_CHUNK_SIZE = int(os.environ.get('BOOK_EXPORT_CHUNK_SIZE', '2000'))
+
+# Dotted path to a books.search backend class; empty picks one from the
+# database vendor (SQLite FTS5, PostgreSQL tsvector, LIKE fallback).
+BOOK_SEARCH_BACKEND = os.environ.get('BOOK_SEARCH_BACKEND', '')
+
+# Cover thumbnails generated after each upload (JPEG and WebP per width), and
+# the size of the background pool rendering them (0 renders inline).
+BOOK_COVER_RENDITION_WIDTHS = [
+    int(width) for width in os.environ.get('BOOK_COVER_RENDITION_WIDTHS', '160,320,640').split(',')
+]
+BOOK_COVER_RENDITION_WORKERS = int(os.environ.get('BOOK_COVER_RENDITION_WORKERS', '2'))
+
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
@@ -25,6 +25,9 @@ urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/auth/", include("accounts.urls")),
     path("api/books/", include("books.urls")), 
+    # Async-native read endpoints, for ASGI deployments
+    path("api/async/auth/", include("accounts.async_urls")),
+    path("api/async/books/", include("books.async_urls")),
 ]
 
 
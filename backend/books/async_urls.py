@@ -0,0 +1,9 @@
+from django.urls import path
+from . import async_views
+
+urlpatterns = [
+    path('', async_views.AsyncBookListView.as_view(), name='async-book-list'),
+    path('<int:pk>/', async_views.AsyncBookDetailView.as_view(), name='async-book-detail'),
+    path('<int:book_id>/notes/', async_views.AsyncBookNotesListView.as_view(), name='async-book-notes-list'),
+    path('choices/', async_views.AsyncBookChoicesView.as_view(), name='async-book-choices'),
+]
@@ -0,0 +1,120 @@
+"""
+Async-native counterparts of the read endpoints in books.views, e.g.
+GET /api/async/books/?genre=fiction&search=dune&page=2
+
+They accept the same query parameters as the sync views (filters, search,
+ordering, page/page_size, fields/exclude) and return the same JSON, read
+through FastListRepresentation and the async ORM (acount, aget, aiterator).
+Conditional GET, the anonymous list cache, cursor pagination and facets
+are only served by the sync views.
+"""
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from book_explorer.async_api import AsyncAPIView
+
+from .counts import acount_queryset
+from .helpers import format_choices
+from .models import Book, UserNote
+from .serializers import FastListRepresentation
+from .views import BookDetailAPIView, BookListCreateAPIView, BookNotesListAPIView
+
+
+class AsyncBookAPIView(AsyncAPIView):
+    """Borrows configuration (queryset, filters, serializer) from a DRF view class."""
+    view_class = None
+
+    def get_view(self, **kwargs):
+        return self.view_class(request=self.api_request, args=(), kwargs=kwargs, format_kwarg=None)
+
+    def get_representation(self, view):
+        return FastListRepresentation(view.get_serializer_class(), view.get_serializer_context())
+
+
+class AsyncBookListView(AsyncBookAPIView):
+    view_class = BookListCreateAPIView
+
+    async def get(self, request):
+        view = self.get_view()
+        # Filter backends only build the query, but picking the search backend
+        # may introspect the database once per process.
+        queryset = await sync_to_async(view.filter_queryset)(view.get_queryset())
+
+        pagination = view.pagination_class()
+        page_size = pagination.get_page_size(self.api_request)
+        count, count_type = await acount_queryset(queryset)
+        total_pages = max(1, math.ceil(count / page_size))
+        page_number = self.get_page_number(request, pagination.page_query_param, total_pages)
+
+        representation = self.get_representation(view)
+        start = (page_number - 1) * page_size
+        rows = queryset.values(*representation.sources)[start:start + page_size]
+        results = representation.to_representation([row async for row in rows.aiterator()])
+
+        url = request.build_absolute_uri()
+        param = pagination.page_query_param
+        previous = None
+        if page_number > 1:
+            previous = remove_query_param(url, param) if page_number == 2 else \
+                replace_query_param(url, param, page_number - 1)
+        return self.respond({
+            'count': count,
+            'count_type': count_type,
+            'next': replace_query_param(url, param, page_number + 1) if page_number < total_pages else None,
+            'previous': previous,
+            'page_size': pagination.page_size,  # as reported by BookPageNumberPagination
+            'current_page': page_number,
+            'total_pages': total_pages,
+            'results': results,
+        })
+
+    def get_page_number(self, request, param, total_pages):
+        value = request.GET.get(param, 1)
+        if value == 'last':
+            return total_pages
+        try:
+            number = int(value)
+        except (TypeError, ValueError):
+            raise NotFound('Invalid page.')
+        if number < 1 or number > total_pages:
+            raise NotFound('Invalid page.')
+        return number
+
+
+class AsyncBookDetailView(AsyncBookAPIView):
+    view_class = BookDetailAPIView
+
+    async def get(self, request, pk):
+        view = self.get_view(pk=pk)
+        representation = self.get_representation(view)
+        try:
+            row = await view.get_queryset().values(*representation.sources).aget(pk=pk)
+        except Book.DoesNotExist:
+            raise Http404('No Book matches the given query.')
+        return self.respond(representation.to_representation([row])[0])
+
+
+class AsyncBookChoicesView(AsyncAPIView):
+
+    async def get(self, request):
+        return self.respond({
+            "genres": format_choices(Book.GENRE_CHOICES),
+            "book_types": format_choices(Book.BOOK_TYPE_CHOICES),
+        })
+
+
+class AsyncBookNotesListView(AsyncBookAPIView):
+    view_class = BookNotesListAPIView
+    authentication_required = True
+
+    async def get(self, request, book_id):
+        if not await Book.objects.filter(id=book_id).aexists():
+            raise NotFound("Book not found")
+        view = self.get_view(book_id=book_id)
+        representation = self.get_representation(view)
+        notes = UserNote.objects.filter(book_id=book_id, user=self.api_request.user).values(*representation.sources)
+        return self.respond(representation.to_representation([row async for row in notes.aiterator()]))
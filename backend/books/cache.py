@@ -0,0 +1,103 @@
+"""
+Cache helpers for the books app.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+CATALOG_VERSION_KEY = 'books:catalog_version'
+CATALOG_MODIFIED_KEY = 'books:catalog_modified'
+LIST_CACHE_HITS_KEY = 'books:list_cache:hits'
+LIST_CACHE_MISSES_KEY = 'books:list_cache:misses'
+
+
+def get_catalog_version():
+    """
+    Return the catalog generation counter.
+
+    Every cache entry derived from Book rows includes this value in its key,
+    so bumping it invalidates all of them at once. The counter starts from the
+    current time in microseconds, so it never goes back to an old value if the
+    key is evicted or the cache is restarted.
+    """
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns() // 1000, timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def get_catalog_last_modified():
+    """
+    Return when the catalog last changed. If that is unknown (fresh or
+    evicted cache), start counting from now.
+    """
+    modified = cache.get(CATALOG_MODIFIED_KEY)
+    if modified is None:
+        cache.add(CATALOG_MODIFIED_KEY, timezone.now(), timeout=None)
+        modified = cache.get(CATALOG_MODIFIED_KEY)
+    return modified
+
+
+def bump_catalog_version():
+    """Invalidate everything cached for the current catalog generation."""
+    cache.set(CATALOG_MODIFIED_KEY, timezone.now(), timeout=None)
+    try:
+        return cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        return get_catalog_version()
+
+
+def book_list_cache_key(request, page_size, page_size_param='page_size'):
+    """
+    Key for a cached book list response: the catalog version plus the
+    normalized query (sorted parameters, page_size clamped by the paginator)
+    and everything else that ends up in the payload (host, scheme, Accept).
+    """
+    params = sorted(
+        (key, value)
+        for key, values in request.GET.lists()
+        if key != page_size_param
+        for value in values
+    )
+    params.append((page_size_param, str(page_size)))
+    raw = '|'.join([
+        repr(sorted(params)),
+        request.scheme,
+        request.get_host(),
+        request.META.get('HTTP_ACCEPT', ''),
+    ])
+    digest = hashlib.sha1(raw.encode()).hexdigest()
+    return f'books:list:{get_catalog_version()}:{digest}'
+
+
+def get_cached_book_list(key):
+    """Return the cached payload for `key` (or None), counting hits and misses."""
+    data = cache.get(key)
+    _increment(LIST_CACHE_HITS_KEY if data is not None else LIST_CACHE_MISSES_KEY)
+    return data
+
+
+def set_cached_book_list(key, data):
+    cache.set(key, data, settings.BOOK_LIST_CACHE_TIMEOUT)
+
+
+def get_book_list_cache_stats():
+    hits = cache.get(LIST_CACHE_HITS_KEY, 0)
+    misses = cache.get(LIST_CACHE_MISSES_KEY, 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+    }
+
+
+def _increment(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
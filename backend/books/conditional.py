@@ -0,0 +1,54 @@
+"""
+Validators for conditional GET (ETag / Last-Modified) on the books API.
+
+Used with django.views.decorators.http.condition, so a request whose
+If-None-Match / If-Modified-Since still matches gets a 304 before anything
+is serialized.
+"""
+import hashlib
+import json
+
+from .cache import get_catalog_last_modified, get_catalog_version
+from .models import Book
+
+
+def representation_digest(request):
+    """Short hash of everything besides the data that shapes the response."""
+    query = sorted(request.GET.lists())
+    accept = request.META.get('HTTP_ACCEPT', '')
+    return hashlib.sha1(f'{query!r}|{accept}'.encode()).hexdigest()[:16]
+
+
+def book_list_etag(request, *args, **kwargs):
+    return f'"books-{get_catalog_version()}-{representation_digest(request)}"'
+
+
+def book_list_last_modified(request, *args, **kwargs):
+    return get_catalog_last_modified()
+
+
+def _book_updated_at(request, pk):
+    """Look up the book's updated_at once per request."""
+    if not hasattr(request, '_book_updated_at'):
+        request._book_updated_at = Book.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+    return request._book_updated_at
+
+
+def book_detail_etag(request, pk, *args, **kwargs):
+    updated_at = _book_updated_at(request, pk)
+    if updated_at is None:
+        return None
+    return f'"book-{pk}-{int(updated_at.timestamp() * 1_000_000)}-{representation_digest(request)}"'
+
+
+def book_detail_last_modified(request, pk, *args, **kwargs):
+    return _book_updated_at(request, pk)
+
+
+CHOICES_ETAG = '"choices-%s"' % hashlib.sha1(
+    json.dumps([Book.GENRE_CHOICES, Book.BOOK_TYPE_CHOICES]).encode()
+).hexdigest()[:16]
+
+
+def choices_etag(request, *args, **kwargs):
+    return CHOICES_ETAG
@@ -0,0 +1,96 @@
+"""
+Count strategies for paginated book listings.
+
+Small result sets are counted exactly. Above BOOK_COUNT_EXACT_THRESHOLD the
+count comes either from the cache, keyed by the filtered query and the
+catalog version, or from the query planner's row estimate.
+"""
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from .cache import get_catalog_version
+
+COUNT_EXACT = 'exact'
+COUNT_CACHED = 'cached'
+COUNT_ESTIMATED = 'estimated'
+
+
+def count_queryset(queryset):
+    """
+    Return a (count, count_type) pair for the queryset.
+
+    The threshold check itself is a bounded COUNT over at most
+    threshold + 1 rows, so it never scans the whole table.
+    """
+    threshold = settings.BOOK_COUNT_EXACT_THRESHOLD
+    queryset = queryset.order_by()
+    bounded = queryset[:threshold + 1].count()
+    if bounded <= threshold:
+        return bounded, COUNT_EXACT
+
+    if settings.BOOK_COUNT_STRATEGY == 'estimate':
+        estimate = estimate_count(queryset)
+        if estimate is not None:
+            return max(estimate, bounded), COUNT_ESTIMATED
+
+    return cached_count(queryset), COUNT_CACHED
+
+
+async def acount_queryset(queryset):
+    """Async counterpart of count_queryset(), for the async views."""
+    threshold = settings.BOOK_COUNT_EXACT_THRESHOLD
+    queryset = queryset.order_by()
+    bounded = await queryset[:threshold + 1].acount()
+    if bounded <= threshold:
+        return bounded, COUNT_EXACT
+
+    if settings.BOOK_COUNT_STRATEGY == 'estimate':
+        estimate = await sync_to_async(estimate_count)(queryset)
+        if estimate is not None:
+            return max(estimate, bounded), COUNT_ESTIMATED
+
+    key = await sync_to_async(count_cache_key)(queryset)
+    count = await cache.aget(key)
+    if count is None:
+        count = await queryset.acount()
+        await cache.aset(key, count, settings.BOOK_COUNT_CACHE_TIMEOUT)
+    return count, COUNT_CACHED
+
+
+def count_cache_key(queryset):
+    sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+    digest = hashlib.sha1(f'{sql}|{params!r}'.encode()).hexdigest()
+    return f'books:count:{get_catalog_version()}:{digest}'
+
+
+def cached_count(queryset):
+    """Exact count, cached until the catalog changes or the entry expires."""
+    key = count_cache_key(queryset)
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, settings.BOOK_COUNT_CACHE_TIMEOUT)
+    return count
+
+
+def estimate_count(queryset):
+    """
+    Return the planner's row estimate for the queryset, or None when the
+    database backend does not expose one (e.g. SQLite).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
@@ -0,0 +1,34 @@
+"""
+Row iteration for the streaming catalog export.
+
+Rows are read with values_list() and a server-side iterator, so memory use
+stays flat regardless of catalog size, and converted to the same values the
+API returns (ISO timestamps, absolute cover image URLs).
+"""
+from rest_framework.fields import DateTimeField
+
+from .models import Book
+
+EXPORT_FIELDS = [field.name for field in Book._meta.concrete_fields if field.name != 'cover_renditions']
+
+
+def iter_export_records(queryset, request, chunk_size):
+    """Yield one tuple of output values per book, in EXPORT_FIELDS order."""
+    datetime_field = DateTimeField()
+    storage = Book._meta.get_field('cover_image').storage
+
+    def cover_url(name):
+        return request.build_absolute_uri(storage.url(name)) if name else None
+
+    def timestamp(value):
+        return datetime_field.to_representation(value) if value is not None else None
+
+    converters = {
+        'cover_image': cover_url,
+        'created_at': timestamp,
+        'updated_at': timestamp,
+    }
+    convert = [converters.get(name) for name in EXPORT_FIELDS]
+
+    for row in queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        yield tuple(value if fn is None else fn(value) for fn, value in zip(convert, row))
@@ -0,0 +1,59 @@
+"""
+Facet counts for the book list, e.g. ?facets=genre,book_type,published_year_decade
+
+Each facet is one grouped COUNT over the filtered queryset, so it can be
+served from the genre/book_type and published_year indexes.
+"""
+from django.db.models import Count, F
+from rest_framework.exceptions import ValidationError
+
+from .models import Book
+
+FACET_PARAM = 'facets'
+
+
+def _choice_facet(field, choices):
+    labels = dict(choices)
+
+    def compute(queryset):
+        rows = queryset.order_by().values_list(field).annotate(count=Count('pk')).order_by(field)
+        return [{'value': value, 'label': labels.get(value, value), 'count': count} for value, count in rows]
+
+    return compute
+
+
+def _decade_facet(queryset):
+    rows = (
+        queryset.order_by()
+        .annotate(decade=F('published_year') / 10 * 10)
+        .values_list('decade')
+        .annotate(count=Count('pk'))
+        .order_by('decade')
+    )
+    return [
+        {'value': decade, 'label': f'{decade}s' if decade is not None else None, 'count': count}
+        for decade, count in rows
+    ]
+
+
+FACETS = {
+    'genre': _choice_facet('genre', Book.GENRE_CHOICES),
+    'book_type': _choice_facet('book_type', Book.BOOK_TYPE_CHOICES),
+    'published_year_decade': _decade_facet,
+}
+
+
+def get_requested_facets(request):
+    """Return the facet names requested with ?facets=, validating them."""
+    value = request.query_params.get(FACET_PARAM, '')
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in FACETS]
+    if unknown:
+        raise ValidationError({
+            FACET_PARAM: [f'Unknown facet "{name}". Available: {", ".join(FACETS)}.' for name in unknown]
+        })
+    return list(dict.fromkeys(names))
+
+
+def compute_facets(queryset, names):
+    return {name: FACETS[name](queryset) for name in names}
@@ -0,0 +1,71 @@
+"""
+Sparse fieldsets, e.g. ?fields=id,title,author,cover_image or ?exclude=description
+
+The selection narrows both the serializer output (through the serializer
+context) and the SQL column list (with .only()), so payload size and
+database I/O shrink together. It only applies to reads; writes always see
+every field.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+
+
+def _split(request, param):
+    value = request.query_params.get(param, '')
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def get_requested_fields(request, available):
+    """
+    Return the field names selected with ?fields= / ?exclude=, in serializer
+    order, or None when neither is given. Unknown names are rejected.
+    """
+    include = _split(request, FIELDS_PARAM)
+    exclude = _split(request, EXCLUDE_PARAM)
+    errors = {}
+    for param, names in ((FIELDS_PARAM, include), (EXCLUDE_PARAM, exclude)):
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            errors[param] = [f'Unknown field "{name}". Available: {", ".join(available)}.' for name in unknown]
+    if errors:
+        raise ValidationError(errors)
+
+    if not include and not exclude:
+        return None
+    return [name for name in available if (not include or name in include) and name not in exclude]
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin for serializers using SparseFieldsetSerializerMixin: passes the
+    selected fields in the serializer context and loads only their columns.
+    """
+
+    def get_sparse_fields(self):
+        if self.request.method not in SAFE_METHODS:
+            return None
+        if not hasattr(self, '_sparse_fields'):
+            available = list(self.get_serializer_class()().fields)
+            self._sparse_fields = get_requested_fields(self.request, available)
+        return self._sparse_fields
+
+    def get_sparse_columns(self):
+        """Return the model fields behind the selected serializer fields, or None for all."""
+        selected = self.get_sparse_fields()
+        if selected is None:
+            return None
+        fields = self.get_serializer_class()().fields
+        return [fields[name].source for name in selected if fields[name].source != '*']
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_sparse_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        columns = self.get_sparse_columns()
+        return queryset if columns is None else queryset.only(*columns)
@@ -0,0 +1,32 @@
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+from .search import SEARCH_RANK, get_search_backend, tokenize
+
+
+class BookSearchFilter(SearchFilter):
+    """
+    ?search= backed by the full-text search backend instead of icontains.
+    ?search_description=true also matches the description.
+    """
+    description_param = 'search_description'
+
+    def filter_queryset(self, request, queryset, view):
+        terms = tokenize(' '.join(self.get_search_terms(request)))
+        if not terms:
+            return queryset
+        include_description = request.query_params.get(self.description_param, '').lower() in ('1', 'true', 'yes')
+        backend = get_search_backend(queryset.db)
+        return backend.search(queryset, terms, include_description=include_description)
+
+
+class BookOrderingFilter(OrderingFilter):
+    """
+    Ordering filter that sorts ranked search results by relevance unless the
+    client asked for an explicit ordering.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if SEARCH_RANK in queryset.query.annotations and not request.query_params.get(self.ordering_param):
+            return ['-' + SEARCH_RANK, *ordering]
+        return ordering
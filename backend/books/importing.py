@@ -0,0 +1,70 @@
+"""
+Row validation for bulk book imports.
+
+Applies the same rules as Book.clean and BookSerializer.validate_* to plain
+dicts, with field limits and choices looked up once up front, so rows can be
+validated without building a model instance and running full_clean().
+"""
+from datetime import datetime
+
+from .models import Book
+
+IMPORT_FIELDS = ['title', 'author', 'description', 'book_type', 'genre', 'published_year']
+
+
+class BookRowValidator:
+
+    def __init__(self):
+        self.max_lengths = {
+            name: Book._meta.get_field(name).max_length for name in ('title', 'author', 'book_type', 'genre')
+        }
+        self.choices = {
+            'book_type': {value for value, _ in Book.BOOK_TYPE_CHOICES},
+            'genre': {value for value, _ in Book.GENRE_CHOICES},
+        }
+        self.max_year = datetime.now().year + 1
+
+    def validate(self, row):
+        """Return (values, errors) for a raw row mapping."""
+        values = {}
+        errors = {}
+
+        for name in ('title', 'author'):
+            value = row.get(name)
+            value = value.strip() if isinstance(value, str) else ''
+            if not value:
+                errors[name] = f'{name.capitalize()} cannot be empty.'
+            elif len(value) > self.max_lengths[name]:
+                errors[name] = f'Ensure this field has no more than {self.max_lengths[name]} characters.'
+            values[name] = value
+
+        description = row.get('description')
+        values['description'] = '' if description is None else str(description)
+
+        for name in ('book_type', 'genre'):
+            value = row.get(name)
+            if value is None or value == '':
+                values[name] = None
+            elif not isinstance(value, str) or value not in self.choices[name]:
+                errors[name] = f'"{value}" is not a valid choice.'
+            else:
+                values[name] = value
+
+        year = row.get('published_year')
+        if year is None or year == '':
+            values['published_year'] = None
+        else:
+            try:
+                year = int(year)
+            except (TypeError, ValueError):
+                errors['published_year'] = 'A valid integer is required.'
+            else:
+                if year < 0:
+                    errors['published_year'] = 'Published year cannot be negative.'
+                elif year > self.max_year:
+                    errors['published_year'] = (
+                        f'Published year cannot be more than {self.max_year} (for pre-orders).'
+                    )
+                values['published_year'] = year
+
+        return values, errors
@@ -0,0 +1,67 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from books.cache import bump_catalog_version
+from books.models import Book
+from books.storage import release_cover
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves existing cover images into content-addressed storage, in place: '
+        'identical files are merged into one blob, books are pointed at it and '
+        'the old copies are deleted.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        field = Book._meta.get_field('cover_image')
+        storage = field.storage
+        names = (
+            Book.objects.exclude(cover_image='').exclude(cover_image__isnull=True)
+            .order_by().values_list('cover_image', flat=True).distinct()
+        )
+
+        moved = merged = missing = reclaimed = 0
+        blobs = set()
+        for name in list(names):
+            if storage.is_blob(name):
+                continue
+            if not storage.exists(name):
+                missing += 1
+                self.stderr.write(f'Missing file: {name}')
+                continue
+
+            size = storage.size(name)
+            # Blobs live directly under upload_to, wherever the old copy was.
+            upload_name = field.generate_filename(None, os.path.basename(name))
+            blob = storage.blob_name(upload_name, storage.digest(name))
+            if blob in blobs or storage.exists(blob):
+                merged += 1
+                reclaimed += size
+            else:
+                moved += 1
+            blobs.add(blob)
+            if dry_run:
+                self.stdout.write(f'{name} -> {blob}')
+                continue
+
+            if not storage.exists(blob):
+                with storage.open(name) as file:
+                    blob = storage.save(upload_name, file)
+            with transaction.atomic():
+                Book.objects.filter(cover_image=name).update(cover_image=blob)
+            release_cover(name)
+
+        if (moved or merged) and not dry_run:
+            bump_catalog_version()
+        prefix = 'Would move' if dry_run else 'Moved'
+        self.stdout.write(self.style.SUCCESS(
+            f'{prefix} {moved} cover(s) into blobs and merged {merged} duplicate(s) '
+            f'({reclaimed} bytes reclaimed); {missing} missing.'
+        ))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from books.models import Book
+from books.renditions import generate_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates cover thumbnails for books uploaded before renditions '
+        'existed (or for every cover with --all, e.g. after changing '
+        'BOOK_COVER_RENDITION_WIDTHS).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Regenerate renditions of every cover')
+
+    def handle(self, *args, **options):
+        books = Book.objects.exclude(cover_image='').exclude(cover_image__isnull=True)
+        if not options['all']:
+            books = books.filter(cover_renditions={})
+
+        generated = failed = 0
+        for book_id in books.values_list('id', flat=True).iterator():
+            try:
+                generate_renditions(book_id)
+                generated += 1
+            except (OSError, ValueError) as error:
+                failed += 1
+                self.stderr.write(f'Book {book_id}: {error}')
+
+        self.stdout.write(self.style.SUCCESS(f'Generated renditions for {generated} book(s), {failed} failed.'))
@@ -0,0 +1,128 @@
+import csv
+import json
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from books.importing import IMPORT_FIELDS, BookRowValidator
+from books.models import Book
+from books.signals import catalog_bulk_changed
+
+
+class Command(BaseCommand):
+    help = (
+        'Imports books from a CSV or JSONL file. Rows are streamed, validated '
+        'without full_clean() and inserted with bulk_create in batches; each '
+        'committed batch is recorded in a checkpoint so an interrupted import '
+        'can be resumed with --resume.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV (with header) or JSONL file')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per INSERT batch and transaction')
+        parser.add_argument('--checkpoint', help='Checkpoint file (default: <path>.checkpoint)')
+        parser.add_argument('--resume', action='store_true', help='Skip rows committed by a previous run')
+        parser.add_argument('--rejects', help='Write rejected rows with their errors to this JSONL file')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        file_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint'
+        skip = self.read_checkpoint(checkpoint_path) if options['resume'] else 0
+
+        validator = BookRowValidator()
+        rejects = open(options['rejects'], 'a' if options['resume'] else 'w') if options['rejects'] else None
+
+        imported = rejected = 0
+        processed = skip
+        batch = []
+        started = time.monotonic()
+        try:
+            with open(path, newline='', encoding='utf-8') as source:
+                for row_number, row in enumerate(self.read_rows(source, file_format), start=1):
+                    if row_number <= skip:
+                        continue
+
+                    if isinstance(row, dict):
+                        values, errors = validator.validate(row)
+                    else:
+                        values, errors = None, {'non_field_errors': row}
+                    if errors:
+                        rejected += 1
+                        if rejects:
+                            rejects.write(json.dumps({'row': row_number, 'errors': errors}) + '\n')
+                    else:
+                        batch.append(Book(**values))
+
+                    if len(batch) >= options['batch_size']:
+                        imported += self.flush(batch, checkpoint_path, row_number)
+                        if options['verbosity'] > 1:
+                            self.report(imported, rejected, started)
+                    processed = row_number
+
+            imported += self.flush(batch, checkpoint_path, processed)
+        finally:
+            if rejects:
+                rejects.close()
+            if imported:
+                catalog_bulk_changed.send(sender=Book)
+
+        self.report(imported, rejected, started, final=True)
+        if skip:
+            self.stdout.write(f'Resumed after row {skip}.')
+
+    def read_rows(self, source, file_format):
+        """Yield one dict per row; malformed JSON lines yield an error message instead."""
+        if file_format == 'csv':
+            for row in csv.DictReader(source):
+                yield {key: value for key, value in row.items() if key in IMPORT_FIELDS}
+            return
+
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield [f'Invalid JSON: {exc.msg}']
+                continue
+            yield row if isinstance(row, dict) else ['Each line must be a JSON object.']
+
+    def flush(self, batch, checkpoint_path, row_number):
+        """Insert the batch in one transaction and record the checkpoint."""
+        count = len(batch)
+        if count:
+            with transaction.atomic():
+                Book.objects.bulk_create(batch, batch_size=count)
+            batch.clear()
+        self.write_checkpoint(checkpoint_path, row_number)
+        return count
+
+    def read_checkpoint(self, checkpoint_path):
+        try:
+            with open(checkpoint_path) as f:
+                return int(json.load(f)['rows'])
+        except FileNotFoundError:
+            return 0
+        except (ValueError, KeyError, TypeError):
+            raise CommandError(f'Invalid checkpoint file: {checkpoint_path}')
+
+    def write_checkpoint(self, checkpoint_path, row_number):
+        tmp_path = f'{checkpoint_path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'rows': row_number}, f)
+        os.replace(tmp_path, checkpoint_path)
+
+    def report(self, imported, rejected, started, final=False):
+        elapsed = time.monotonic() - started
+        rate = imported / elapsed if elapsed else 0
+        message = f'Imported {imported} books, rejected {rejected} rows in {elapsed:.1f}s ({rate:,.0f} rows/sec)'
+        self.stdout.write(self.style.SUCCESS(message) if final else message)
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+from books.search import FTS_TABLE, SQLITE_FTS_TRIGGERS, PostgresSearchBackend, install_sqlite_fts
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        install_sqlite_fts(connection)
+    elif connection.vendor == 'postgresql':
+        from django.contrib.postgres.indexes import GinIndex
+
+        Book = apps.get_model('books', 'Book')
+        backend = PostgresSearchBackend()
+        schema_editor.add_index(Book, GinIndex(backend.vector(False), name='books_book_search_idx'))
+        schema_editor.add_index(Book, GinIndex(backend.vector(True), name='books_book_search_desc_idx'))
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'sqlite':
+        for trigger in SQLITE_FTS_TRIGGERS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+    elif connection.vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS books_book_search_idx')
+        schema_editor.execute('DROP INDEX IF EXISTS books_book_search_desc_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0003_usernote'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.27 on 2026-10-18 02:12
+
+from django.db import migrations, models
+
+from books.search import install_sqlite_fts
+
+
+def restore_search_triggers(apps, schema_editor):
+    # SQLite rebuilds books_book to add the column, which drops its triggers.
+    if schema_editor.connection.vendor == 'sqlite':
+        install_sqlite_fts(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0004_book_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
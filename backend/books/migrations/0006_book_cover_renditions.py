@@ -0,0 +1,27 @@
+# Generated by Django 4.2.27 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+from books.search import install_sqlite_fts
+
+
+def restore_search_triggers(apps, schema_editor):
+    # SQLite rebuilds books_book to add the column, which drops its triggers.
+    if schema_editor.connection.vendor == 'sqlite':
+        install_sqlite_fts(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0005_book_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='cover_renditions',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.27 on 2026-10-18 02:29
+
+import books.storage
+from django.db import migrations, models
+
+from books.search import install_sqlite_fts
+
+
+def restore_search_triggers(apps, schema_editor):
+    # SQLite rebuilds books_book to alter the field, which drops its triggers.
+    if schema_editor.connection.vendor == 'sqlite':
+        install_sqlite_fts(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0006_book_cover_renditions'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='book',
+            name='cover_image',
+            field=models.ImageField(blank=True, null=True, storage=books.storage.ContentAddressedStorage(), upload_to='book_covers/'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
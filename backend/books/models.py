@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from datetime import datetime
 
+from .storage import cover_storage
+
 User = get_user_model()
 
 class Book(models.Model):
@@ -41,15 +43,21 @@ class Book(models.Model):
         db_index=True,
     )
 
+    # Stored content-addressed, so identical covers share a single file.
     cover_image = models.ImageField(
         upload_to="book_covers/",
+        storage=cover_storage,
         null=True,
         blank=True,
     )
+    # Thumbnails of cover_image, {width: {format: storage name}}; filled in
+    # by books.renditions after each upload.
+    cover_renditions = models.JSONField(default=dict, blank=True, editable=False)
 
     published_year = models.IntegerField(null=True, blank=True, db_index=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         indexes = [
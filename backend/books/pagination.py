@@ -1,5 +1,32 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from datetime import date, datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .counts import count_queryset
+
+
+class BookPaginator(Paginator):
+    """
+    Paginator that takes its count from the count strategy layer instead of
+    always running a full COUNT(*). `count_type` reports which kind of count
+    was used.
+    """
+    count_type = None
+
+    @cached_property
+    def count(self):
+        count, self.count_type = count_queryset(self.object_list)
+        return count
 
 
 class BookPageNumberPagination(PageNumberPagination):
@@ -7,6 +34,7 @@ class BookPageNumberPagination(PageNumberPagination):
     Custom pagination class for books API.
     Returns paginated results with metadata.
     """
+    django_paginator_class = BookPaginator
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
@@ -17,6 +45,7 @@ class BookPageNumberPagination(PageNumberPagination):
         """
         return Response({
             'count': self.page.paginator.count,
+            'count_type': self.page.paginator.count_type,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'page_size': self.page_size,
@@ -24,3 +53,180 @@ class BookPageNumberPagination(PageNumberPagination):
             'total_pages': self.page.paginator.num_pages,
             'results': data
         })
+
+
+class BookKeysetPagination(BasePagination):
+    """
+    Opt-in keyset (cursor) pagination for books API.
+
+    Instead of OFFSET, each page seeks past the sort key of the last row of the
+    previous page, with `id` as a tiebreaker, so deep pages cost the same as
+    the first one. No COUNT(*) query is run. NULLs sort as the largest value,
+    which matches the default PostgreSQL btree ordering.
+    """
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    mode_value = 'cursor'
+    tiebreaker = 'id'
+    invalid_cursor_message = 'Invalid cursor'
+
+    @classmethod
+    def is_requested(cls, request):
+        """Clients opt in with ?pagination=cursor or by following a cursor link."""
+        params = request.query_params
+        return params.get(cls.mode_query_param) == cls.mode_value or cls.cursor_query_param in params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.model = queryset.model
+        self.keys = self.get_keys(queryset)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['r'])
+        keys = [(name, descending != reverse) for name, descending in self.keys]
+
+        queryset = queryset.order_by(*[self.order_expression(name, descending) for name, descending in keys])
+        if cursor is not None:
+            queryset = queryset.filter(self.seek_condition(keys, cursor['v']))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'page_size': self.page_size,
+            'results': data
+        })
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                size = int(request.query_params[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_keys(self, queryset):
+        """
+        Build the sort key from the ordering already applied to the queryset
+        (by OrderingFilter), as a list of (field name, descending) pairs that
+        always ends with the tiebreaker.
+        """
+        keys = []
+        for entry in queryset.query.order_by:
+            if not isinstance(entry, str) or entry == '?':
+                continue
+            name = entry.lstrip('-')
+            if name in ('pk', self.tiebreaker) or name in (key[0] for key in keys):
+                continue
+            keys.append((name, entry.startswith('-')))
+        keys.append((self.tiebreaker, keys[-1][1] if keys else False))
+        return keys
+
+    def order_expression(self, name, descending):
+        if self.is_nullable(name):
+            return F(name).desc(nulls_first=True) if descending else F(name).asc(nulls_last=True)
+        return F(name).desc() if descending else F(name).asc()
+
+    def is_nullable(self, name):
+        try:
+            return self.model._meta.get_field(name).null
+        except FieldDoesNotExist:
+            return False
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, row, reverse):
+        values = []
+        for name, _ in self.keys:
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            values.append(value)
+        payload = {'o': self.ordering_signature(), 'r': int(reverse), 'v': values}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        url = remove_query_param(self.base_url, 'page')
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        """
+        Return the decoded cursor, or None on the first page. Cursors that are
+        malformed or were issued for a different ordering raise NotFound.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if payload['o'] != self.ordering_signature() or len(payload['v']) != len(self.keys):
+                raise ValueError
+            values = [self.to_python(name, value) for (name, _), value in zip(self.keys, payload['v'])]
+            return {'r': bool(payload['r']), 'v': values}
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError, binascii.Error, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def to_python(self, name, value):
+        if value is None:
+            return None
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return value
+        return field.to_python(value)
+
+    def ordering_signature(self):
+        return [('-' if descending else '') + name for name, descending in self.keys]
+
+    def seek_condition(self, keys, values):
+        """
+        Build the WHERE clause selecting rows strictly after `values` in the
+        order given by `keys`, i.e. the expanded form of the row comparison
+        (k1, k2, ...) > (v1, v2, ...) with NULL treated as the largest value.
+        """
+        (name, descending), value = keys[0], values[0]
+        nullable = self.is_nullable(name)
+        if value is None:
+            after = Q(**{f'{name}__isnull': False}) if descending else None
+        elif descending:
+            after = Q(**{f'{name}__lt': value})
+        else:
+            after = Q(**{f'{name}__gt': value})
+            if nullable:
+                after |= Q(**{f'{name}__isnull': True})
+
+        if len(keys) == 1:
+            return after
+
+        same = Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+        rest = same & self.seek_condition(keys[1:], values[1:])
+        return rest if after is None else after | rest
+
@@ -0,0 +1,60 @@
+"""
+Renderers for the streaming catalog export.
+
+They are used for content negotiation (?format=ndjson|csv or the Accept
+header). The export view streams rows through `stream()`; `render()` only
+handles regular responses such as errors.
+"""
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+    lines_per_chunk = 200
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, default=str) + '\n'
+
+    def stream(self, fields, records):
+        lines = []
+        for record in records:
+            lines.append(json.dumps(dict(zip(fields, record)), ensure_ascii=False))
+            if len(lines) >= self.lines_per_chunk:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+    lines_per_chunk = 200
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, default=str) + '\n'
+
+    def stream(self, fields, records):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        lines = []
+        for record in records:
+            lines.append(writer.writerow(record))
+            if len(lines) >= self.lines_per_chunk:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
@@ -0,0 +1,130 @@
+"""
+Cover image renditions: fixed-width thumbnails in JPEG and WebP.
+
+When a cover is uploaded through BookSerializer, the renditions are
+generated after the transaction commits, in a small background thread pool,
+so the upload request is not blocked. Each rendition is stored next to the
+covers under a content-hashed name, e.g.
+
+    book_covers/renditions/dune-320w.3f2a9c1b7e4d.webp
+
+so a given URL always serves the same bytes and can be cached forever.
+`Book.cover_renditions` maps width -> format -> name in the default storage.
+"""
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .cache import bump_catalog_version
+from .models import Book
+
+logger = logging.getLogger(__name__)
+
+RENDITION_DIR = 'book_covers/renditions'
+
+# Output format -> (Pillow format name, file extension, save options)
+FORMATS = {
+    'jpeg': ('JPEG', 'jpg', {'quality': 85, 'optimize': True, 'progressive': True}),
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+}
+
+
+def render(image, width, output_format):
+    """Return `image` scaled down to `width` (never up) and encoded as bytes."""
+    pillow_format, _, options = FORMATS[output_format]
+    rendition = image
+    if image.width > width:
+        rendition = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+    has_alpha = 'A' in rendition.getbands() or 'transparency' in rendition.info
+    mode = 'RGBA' if output_format == 'webp' and has_alpha else 'RGB'
+    if rendition.mode != mode:
+        rendition = rendition.convert(mode)
+    buffer = BytesIO()
+    rendition.save(buffer, format=pillow_format, **options)
+    return buffer.getvalue()
+
+
+def rendition_name(cover_name, width, output_format, data):
+    stem = os.path.splitext(os.path.basename(cover_name))[0]
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    return f'{RENDITION_DIR}/{stem}-{width}w.{digest}.{FORMATS[output_format][1]}'
+
+
+def generate_renditions(book_id):
+    """
+    Render, store and record every rendition of a book's current cover.
+    Returns the renditions map ({} when the book has no cover). The row is
+    only updated if the cover did not change in the meantime.
+    """
+    cover_name = Book.objects.filter(pk=book_id).values_list('cover_image', flat=True).first()
+    if not cover_name:
+        return {}
+
+    with Book._meta.get_field('cover_image').storage.open(cover_name) as file:
+        image = ImageOps.exif_transpose(Image.open(file))
+        image.load()
+
+    renditions = {}
+    for width in settings.BOOK_COVER_RENDITION_WIDTHS:
+        renditions[str(width)] = {}
+        for output_format in FORMATS:
+            data = render(image, width, output_format)
+            name = rendition_name(cover_name, width, output_format, data)
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(data))
+            renditions[str(width)][output_format] = name
+
+    updated = Book.objects.filter(pk=book_id, cover_image=cover_name).update(
+        cover_renditions=renditions, updated_at=timezone.now()
+    )
+    if updated:
+        bump_catalog_version()
+    return renditions
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BOOK_COVER_RENDITION_WORKERS,
+                thread_name_prefix='cover-renditions',
+            )
+    return _executor
+
+
+def _generate_in_worker(book_id):
+    try:
+        generate_renditions(book_id)
+    except Exception:
+        logger.exception('Generating cover renditions for book %s failed', book_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_renditions(book_id):
+    """
+    Generate the book's renditions once the current transaction commits:
+    in the worker pool, or inline when BOOK_COVER_RENDITION_WORKERS is 0.
+    """
+    def submit():
+        if settings.BOOK_COVER_RENDITION_WORKERS > 0:
+            get_executor().submit(_generate_in_worker, book_id)
+        else:
+            generate_renditions(book_id)
+
+    transaction.on_commit(submit)
@@ -0,0 +1,172 @@
+"""
+Full-text search backends for books.
+
+The backend is picked from the database vendor unless BOOK_SEARCH_BACKEND
+names one explicitly:
+
+- SQLite: an external-content FTS5 table (`books_book_fts`) kept in sync with
+  `books_book` by triggers, ranked with bm25.
+- PostgreSQL: a weighted `tsvector` expression served by GIN indexes, ranked
+  with ts_rank.
+- Anything else (or SQLite without FTS5): the previous `icontains` matching.
+
+Every term is matched as a prefix, so "har cob" finds "Harlan Coben".
+Ranked backends annotate the queryset with `search_rank` (higher is better).
+"""
+import operator
+import re
+from functools import reduce
+
+from django.conf import settings
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+SEARCH_RANK = 'search_rank'
+
+FTS_TABLE = 'books_book_fts'
+
+SQLITE_FTS_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, author, description,
+        content='books_book', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON books_book BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, author, description)
+        VALUES (new.id, new.title, new.author, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON books_book BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, author, description)
+        VALUES ('delete', old.id, old.title, old.author, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, author, description ON books_book BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, author, description)
+        VALUES ('delete', old.id, old.title, old.author, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, author, description)
+        VALUES (new.id, new.title, new.author, new.description);
+    END
+    """,
+]
+
+SQLITE_FTS_TRIGGERS = [f'{FTS_TABLE}_ai', f'{FTS_TABLE}_ad', f'{FTS_TABLE}_au']
+
+
+def tokenize(value):
+    """Split a search string into lowercase word tokens."""
+    return re.findall(r'\w+', value.lower())
+
+
+def install_sqlite_fts(connection):
+    """
+    Create the FTS5 table and its sync triggers if they are missing, and
+    rebuild the index when triggers had to be (re)created, e.g. after SQLite
+    remade `books_book` during a migration and dropped them.
+
+    Returns False when this SQLite build has no FTS5 support.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name IN (%s, %s, %s)",
+            SQLITE_FTS_TRIGGERS,
+        )
+        if len(cursor.fetchall()) == len(SQLITE_FTS_TRIGGERS):
+            return True
+        try:
+            with transaction.atomic(using=connection.alias):
+                for statement in SQLITE_FTS_SCHEMA:
+                    cursor.execute(statement)
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        except DatabaseError:
+            return False
+    return True
+
+
+class LikeSearchBackend:
+    """Substring matching on every term, without ranking."""
+    ranked = False
+
+    def search(self, queryset, terms, include_description=False):
+        fields = ['title', 'author'] + (['description'] if include_description else [])
+        conditions = (
+            reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in fields))
+            for term in terms
+        )
+        return queryset.filter(reduce(operator.and_, conditions))
+
+
+class SQLiteFTS5Backend:
+    """FTS5 prefix queries ranked with bm25 (title > author > description)."""
+    ranked = True
+    weights = (10.0, 5.0, 1.0)
+
+    def match_expression(self, terms, include_description):
+        columns = '{title author description}' if include_description else '{title author}'
+        return ' AND '.join(f'{columns} : "{term}"*' for term in terms)
+
+    def search(self, queryset, terms, include_description=False):
+        expression = self.match_expression(terms, include_description)
+        table = queryset.model._meta.db_table
+        weights = ', '.join(str(weight) for weight in self.weights)
+        matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [expression])
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id"',
+            [expression],
+        )
+        return queryset.filter(id__in=matches).annotate(**{SEARCH_RANK: rank})
+
+
+class PostgresSearchBackend:
+    """
+    tsvector prefix queries ranked with ts_rank. The vectors match the GIN
+    indexes created in migration 0004, so the WHERE clause can use them.
+    """
+    ranked = True
+    config = 'simple'
+
+    def vector(self, include_description):
+        from django.contrib.postgres.search import SearchVector
+
+        vector = SearchVector('title', weight='A', config=self.config) + \
+            SearchVector('author', weight='B', config=self.config)
+        if include_description:
+            vector += SearchVector('description', weight='C', config=self.config)
+        return vector
+
+    def search(self, queryset, terms, include_description=False):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        vector = self.vector(include_description)
+        query = SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=self.config)
+        return queryset.annotate(search_vector=vector).filter(search_vector=query).annotate(
+            **{SEARCH_RANK: SearchRank(vector, query)}
+        )
+
+
+_fts5_ready = {}
+
+
+def get_search_backend(using='default'):
+    """Return the search backend for the given database alias."""
+    if settings.BOOK_SEARCH_BACKEND:
+        return import_string(settings.BOOK_SEARCH_BACKEND)()
+
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if connection.vendor == 'sqlite':
+        name = str(connection.settings_dict['NAME'])
+        if name not in _fts5_ready:
+            _fts5_ready[name] = FTS_TABLE in connection.introspection.table_names()
+        if _fts5_ready[name]:
+            return SQLiteFTS5Backend()
+    return LikeSearchBackend()
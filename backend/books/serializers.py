@@ -1,11 +1,101 @@
+from django.core.files.storage import default_storage
+from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from datetime import datetime
 from .models import Book, UserNote
+from .renditions import schedule_renditions
+from .storage import schedule_cover_release
+
+
+class BookListSerializer(serializers.ListSerializer):
+    """
+    Bulk variant of BookSerializer (used with many=True). Items are validated
+    in one pass and written with a single bulk_create / bulk_update, which
+    skips Book.save() and its full_clean(); the field validators below cover
+    the same rules.
+    """
+
+    def create(self, validated_data):
+        books = [Book(**attrs) for attrs in validated_data]
+        return Book.objects.bulk_create(books)
+
+    def update(self, instances, validated_data):
+        """Apply validated_data[i] to instances[i]."""
+        now = timezone.now()
+        fields = {'updated_at'}
+        for book, attrs in zip(instances, validated_data):
+            for name, value in attrs.items():
+                setattr(book, name, value)
+            fields.update(attrs)
+            book.updated_at = now
+        Book.objects.bulk_update(instances, sorted(fields))
+        return instances
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Keep only the fields named in context['fields'] (see books.fieldsets);
+    every field is kept when it is missing or None.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected = self.context.get('fields')
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+
+class CoverRenditionsField(serializers.Field):
+    """
+    Read-only output of Book.cover_renditions with storage names turned into
+    (absolute) URLs: {"320": {"jpeg": "...", "webp": "..."}}.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        request = self.context.get('request')
+
+        def url(name):
+            location = default_storage.url(name)
+            return request.build_absolute_uri(location) if request is not None else location
+
+        return {width: {fmt: url(name) for fmt, name in formats.items()} for width, formats in value.items()}
+
+
+class BookSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    cover_renditions = CoverRenditionsField()
 
-class BookSerializer(serializers.ModelSerializer):
     class Meta:
         model = Book
         fields = "__all__"
+        list_serializer_class = BookListSerializer
+
+    def create(self, validated_data):
+        book = super().create(validated_data)
+        if book.cover_image:
+            schedule_renditions(book.pk)
+        return book
+
+    def update(self, instance, validated_data):
+        """
+        Renditions of a replaced cover are dropped and generated again, and
+        the old blob is deleted if no other book shares it.
+        """
+        cover_changed = 'cover_image' in validated_data
+        previous, previous_renditions = instance.cover_image.name, instance.cover_renditions
+        if cover_changed:
+            instance.cover_renditions = {}
+        book = super().update(instance, validated_data)
+        if cover_changed and book.cover_image:
+            schedule_renditions(book.pk)
+        if cover_changed and previous != book.cover_image.name:
+            schedule_cover_release(previous, previous_renditions)
+        return book
 
     def validate_published_year(self, value):
         """Validate published_year is within reasonable range"""
@@ -32,7 +122,59 @@ class BookSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
-class UserNoteSerializer(serializers.ModelSerializer):
+class FastListRepresentation:
+    """
+    Read-only, dict-based twin of a ModelSerializer for list hot loops.
+
+    Works on rows fetched with `.values(*representation.sources)` instead of
+    model instances. Each serializer field is compiled once into a plain
+    accessor: ids, strings and choices are passed through as is, files are
+    turned into absolute URLs straight from the storage, and any other field
+    falls back to its own to_representation(). The output is the same as
+    `serializer_class(instances, many=True).data`.
+    """
+    passthrough_fields = (serializers.IntegerField, serializers.CharField, serializers.ChoiceField)
+
+    def __init__(self, serializer_class, context=None):
+        serializer = serializer_class(context=context or {})
+        self.model = serializer.Meta.model
+        self.request = serializer.context.get('request')
+        self.fields = [
+            (name, field.source, self.compile(field))
+            for name, field in serializer.fields.items()
+            if not field.write_only
+        ]
+        self.sources = [source for _, source, _ in self.fields]
+
+    def compile(self, field):
+        """Return a converter for non-null values, or None to pass them through."""
+        if type(field) in self.passthrough_fields:
+            return None
+        if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field is None:
+            return None  # .values() already yields the related pk
+        if isinstance(field, serializers.FileField):
+            if not getattr(field, 'use_url', api_settings.UPLOADED_FILES_USE_URL):
+                return lambda name: name or None
+            storage = self.model._meta.get_field(field.source).storage
+            request = self.request
+            if request is None:
+                return lambda name: storage.url(name) if name else None
+            return lambda name: request.build_absolute_uri(storage.url(name)) if name else None
+        return field.to_representation
+
+    def to_representation(self, rows):
+        fields = self.fields
+        data = []
+        for row in rows:
+            item = {}
+            for name, source, convert in fields:
+                value = row[source]
+                item[name] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+class UserNoteSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = UserNote
         fields = ['id', 'book', 'note', 'created_at', 'updated_at']
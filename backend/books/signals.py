@@ -0,0 +1,60 @@
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import Signal, receiver
+
+from .cache import bump_catalog_version
+from .models import Book
+from .search import FTS_TABLE, install_sqlite_fts
+from .storage import schedule_cover_release
+from .suggest import suggest_index
+
+# Sent after books are written in bulk (bulk_create, bulk_update,
+# queryset.update/delete), which bypass the per-instance signals below.
+catalog_bulk_changed = Signal()
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def book_changed(sender, instance, **kwargs):
+    """Invalidate cached catalog data whenever a book is saved or deleted."""
+    bump_catalog_version()
+
+
+@receiver(post_save, sender=Book)
+def book_saved_update_suggestions(sender, instance, **kwargs):
+    """Add the saved book to the typeahead index once the write is committed."""
+    book_id, title, author = instance.pk, instance.title, instance.author
+    transaction.on_commit(lambda: suggest_index.add_book(book_id, title, author))
+
+
+@receiver(post_delete, sender=Book)
+def book_deleted_update_suggestions(sender, instance, **kwargs):
+    """Remove the deleted book from the typeahead index once committed."""
+    book_id = instance.pk
+    transaction.on_commit(lambda: suggest_index.remove_book(book_id))
+
+
+@receiver(post_delete, sender=Book)
+def book_deleted_release_cover(sender, instance, **kwargs):
+    """Delete the cover blob once committed, if no other book shares it."""
+    schedule_cover_release(instance.cover_image.name, instance.cover_renditions)
+
+
+@receiver(catalog_bulk_changed)
+def catalog_bulk_changed_handler(sender, **kwargs):
+    """Invalidate cached catalog data and rebuild the typeahead index lazily."""
+    bump_catalog_version()
+    transaction.on_commit(suggest_index.reset)
+
+
+@receiver(post_migrate)
+def ensure_search_index(sender, using, **kwargs):
+    """
+    SQLite drops triggers when a migration remakes `books_book`, so re-create
+    the full-text sync triggers (and rebuild the index) if they went missing.
+    """
+    if sender.name != 'books':
+        return
+    connection = connections[using]
+    if connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names():
+        install_sqlite_fts(connection)
@@ -0,0 +1,118 @@
+"""
+Content-addressed storage for book covers.
+
+Uploads are hashed (SHA-256) while they are streamed to disk and stored as
+
+    book_covers/3f/3f2a9c...e4d.jpg
+
+so identical files uploaded for different books share one blob. A blob's
+reference count is the number of books whose cover_image points at it;
+release_cover() deletes it (and its renditions) only when that reaches zero.
+"""
+import hashlib
+import os
+import tempfile
+
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import transaction
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """FileSystemStorage that names files after the SHA-256 of their content."""
+    hash_algorithm = 'sha256'
+    fan_out = 2
+
+    def blob_name(self, name, digest):
+        """Name of the blob with `digest`, in the directory and with the extension of `name`."""
+        directory = os.path.dirname(name)
+        extension = os.path.splitext(name)[1].lower()
+        return os.path.join(directory, digest[:self.fan_out], f'{digest}{extension}').replace('\\', '/')
+
+    def is_blob(self, name):
+        """Whether `name` already is a content-addressed blob name."""
+        directory, filename = os.path.split(name)
+        digest = os.path.splitext(filename)[0]
+        return (
+            len(digest) == hashlib.new(self.hash_algorithm).digest_size * 2
+            and all(c in '0123456789abcdef' for c in digest)
+            and os.path.basename(directory) == digest[:self.fan_out]
+        )
+
+    def digest(self, name):
+        """Hex digest of the stored file `name`, read in chunks."""
+        digest = hashlib.new(self.hash_algorithm)
+        with self.open(name) as file:
+            for chunk in file.chunks():
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _save(self, name, content):
+        directory = os.path.dirname(self.path(name))
+        os.makedirs(directory, exist_ok=True)
+        if self.directory_permissions_mode is not None:
+            os.chmod(directory, self.directory_permissions_mode)
+
+        digest = hashlib.new(self.hash_algorithm)
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        try:
+            with os.fdopen(descriptor, 'wb') as temporary:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    temporary.write(chunk)
+
+            blob = self.blob_name(name, digest.hexdigest())
+            path = self.path(blob)
+            if os.path.exists(path):
+                os.remove(temporary_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(temporary_path, self.file_permissions_mode)
+                os.replace(temporary_path, path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return blob
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content hash; existing files are reused.
+        return name
+
+
+def cover_references(name):
+    """Number of books whose cover is the blob `name`."""
+    from .models import Book
+
+    return Book.objects.filter(cover_image=name).count()
+
+
+def release_cover(name, renditions=None):
+    """
+    Delete the cover blob `name` and the given renditions of it if no book
+    references it any more. Returns True when the blob was deleted.
+    """
+    from .models import Book
+
+    if not name or cover_references(name):
+        return False
+    Book._meta.get_field('cover_image').storage.delete(name)
+    for formats in (renditions or {}).values():
+        for rendition in formats.values():
+            default_storage.delete(rendition)
+    return True
+
+
+def schedule_cover_release(name, renditions=None):
+    """Release the cover once the current transaction commits."""
+    if name:
+        transaction.on_commit(lambda: release_cover(name, renditions))
+
+
+cover_storage = ContentAddressedStorage()
@@ -0,0 +1,128 @@
+"""
+In-memory prefix index behind the title/author typeahead endpoint.
+
+The index is a sorted list of (key, field, value) entries searched with
+bisect, where `key` is the normalized text starting at each word of a title
+or author, so "cob" completes "Harlan Coben" as well as "Cobweb". It is built
+from the Book table on first use in each process and then kept up to date by
+model signals, so lookups never touch the database.
+"""
+import threading
+from bisect import bisect_left, insort
+
+TITLE = 'title'
+AUTHOR = 'author'
+
+
+def normalize(value):
+    return ' '.join(value.casefold().split())
+
+
+def word_keys(value):
+    """Return the normalized value starting at each of its words."""
+    words = normalize(value).split(' ')
+    return [' '.join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+class PrefixIndex:
+    """Thread-safe sorted-array prefix index over book titles and authors."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = None
+        self._counts = {}
+        self._books = {}
+
+    @property
+    def is_built(self):
+        return self._entries is not None
+
+    def build(self):
+        """Load every title and author from the database."""
+        from .models import Book
+
+        entries = []
+        counts = {}
+        books = {}
+        for book_id, title, author in Book.objects.values_list('id', 'title', 'author').iterator(chunk_size=2000):
+            books[book_id] = (title, author)
+            for field, value in ((TITLE, title), (AUTHOR, author)):
+                counts[(field, value)] = counts.get((field, value), 0) + 1
+                if counts[(field, value)] == 1:
+                    entries.extend((key, field, value) for key in word_keys(value))
+        entries.sort()
+
+        with self._lock:
+            self._entries, self._counts, self._books = entries, counts, books
+
+    def reset(self):
+        """Drop the index; it is rebuilt on the next lookup."""
+        with self._lock:
+            self._entries, self._counts, self._books = None, {}, {}
+
+    def suggest(self, prefix, limit=10):
+        """Return up to `limit` distinct (field, value) completions of `prefix`."""
+        if not self.is_built:
+            self.build()
+
+        key = normalize(prefix)
+        if not key:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            entries = self._entries or []
+            position = bisect_left(entries, (key,))
+            while position < len(entries) and len(results) < limit:
+                entry_key, field, value = entries[position]
+                if not entry_key.startswith(key):
+                    break
+                if (field, value) not in seen:
+                    seen.add((field, value))
+                    results.append((field, value))
+                position += 1
+        return results
+
+    def add_book(self, book_id, title, author):
+        with self._lock:
+            if self._entries is None:
+                return
+            self._remove(book_id)
+            self._books[book_id] = (title, author)
+            for field, value in ((TITLE, title), (AUTHOR, author)):
+                self._increment(field, value)
+
+    def remove_book(self, book_id):
+        with self._lock:
+            if self._entries is not None:
+                self._remove(book_id)
+
+    def _remove(self, book_id):
+        previous = self._books.pop(book_id, None)
+        if previous is None:
+            return
+        title, author = previous
+        for field, value in ((TITLE, title), (AUTHOR, author)):
+            self._decrement(field, value)
+
+    def _increment(self, field, value):
+        count = self._counts.get((field, value), 0) + 1
+        self._counts[(field, value)] = count
+        if count == 1:
+            for key in word_keys(value):
+                insort(self._entries, (key, field, value))
+
+    def _decrement(self, field, value):
+        count = self._counts.get((field, value), 0) - 1
+        if count > 0:
+            self._counts[(field, value)] = count
+            return
+        self._counts.pop((field, value), None)
+        for key in word_keys(value):
+            position = bisect_left(self._entries, (key, field, value))
+            if position < len(self._entries) and self._entries[position] == (key, field, value):
+                del self._entries[position]
+
+
+suggest_index = PrefixIndex()
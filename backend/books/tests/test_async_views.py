@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import AsyncClient
+from django.urls import resolve
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from books.models import Book, UserNote
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Create an API client for making requests"""
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    """Create a test user"""
+    return User.objects.create_user(username='asyncuser', password='testpass123')
+
+
+@pytest.fixture
+def auth_header(user):
+    """Authorization header with an access token for the test user"""
+    return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+
+@pytest.fixture
+def books():
+    """Create books across genres"""
+    return [
+        Book.objects.create(title=f'Async {i}', author=f'Author {i % 3}', genre=genre, published_year=2000 + i)
+        for i, genre in enumerate(['fiction', 'fantasy', 'fiction', 'sci_fi', 'fiction'])
+    ]
+
+
+@pytest.mark.parametrize('query', [
+    '',
+    '?genre=fiction',
+    '?search=async&ordering=-published_year',
+    '?page_size=2&page=2&ordering=title',
+    '?page_size=2&page=last',
+    '?fields=id,title&ordering=author',
+])
+def test_async_list_matches_sync_list(api_client, books, query):
+    """The async list returns the same JSON as the DRF list"""
+    sync = api_client.get(f'/api/books/{query}')
+    response = api_client.get(f'/api/async/books/{query}')
+    assert response.status_code == status.HTTP_200_OK
+    expected = sync.json()
+    for link in ('next', 'previous'):
+        if expected[link]:
+            expected[link] = expected[link].replace('/api/books/', '/api/async/books/')
+    assert response.json() == expected
+
+
+class TestAsyncBookViews:
+    """Tests for the async-native book read endpoints"""
+
+    def test_views_are_coroutines(self):
+        """The read endpoints are native async views"""
+        for url in ('/api/async/books/', '/api/async/books/1/', '/api/async/books/choices/',
+                    '/api/async/books/1/notes/', '/api/async/auth/me/'):
+            assert asyncio.iscoroutinefunction(resolve(url).func)
+
+    def test_list_through_async_client(self, books):
+        """The list is served by the ASGI handler"""
+        async def get():
+            return await AsyncClient().get('/api/async/books/?genre=fiction')
+
+        response = async_to_sync(get)()
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['count'] == Book.objects.filter(genre='fiction').count()
+
+    def test_invalid_page_returns_not_found(self, api_client, books):
+        """Pages past the end are rejected like in the DRF list"""
+        response = api_client.get('/api/async/books/?page=99')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()['error']['message'] == 'Invalid page.'
+
+    def test_unknown_field_returns_bad_request(self, api_client, books):
+        """Sparse fieldset validation errors use the API error format"""
+        response = api_client.get('/api/async/books/?fields=colour')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.json()['error']['details']
+
+    def test_detail_matches_sync_detail(self, api_client, books):
+        """The async detail returns the same JSON as the DRF detail"""
+        book = books[0]
+        assert api_client.get(f'/api/async/books/{book.id}/').json() == \
+            api_client.get(f'/api/books/{book.id}/').json()
+
+    def test_detail_missing_book_returns_not_found(self, api_client):
+        """Unknown ids return 404"""
+        response = api_client.get('/api/async/books/999999/')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_choices_match_sync_choices(self, api_client):
+        """The async choices return the same JSON as the DRF view"""
+        assert api_client.get('/api/async/books/choices/').json() == api_client.get('/api/books/choices/').json()
+
+    def test_notes_require_authentication(self, api_client, books):
+        """Notes are private"""
+        response = api_client.get(f'/api/async/books/{books[0].id}/notes/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_notes_match_sync_notes(self, api_client, books, user, auth_header):
+        """The async notes list returns the user's notes like the DRF view"""
+        other = User.objects.create_user(username='other', password='testpass123')
+        UserNote.objects.create(user=user, book=books[0], note='Mine')
+        UserNote.objects.create(user=user, book=books[0], note='Also mine')
+        UserNote.objects.create(user=other, book=books[0], note='Theirs')
+        url = f'/api/books/{books[0].id}/notes/'
+        response = api_client.get(url.replace('/api/', '/api/async/'), **auth_header)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == api_client.get(url, **auth_header).json()
+        assert len(response.json()) == 2
+
+    def test_notes_for_missing_book_return_not_found(self, api_client, auth_header):
+        """Notes of an unknown book return 404"""
+        response = api_client.get('/api/async/books/999999/notes/', **auth_header)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,87 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from books.models import Book
+
+pytestmark = pytest.mark.django_db
+
+
+CSV_ROWS = """title,author,description,genre,book_type,published_year,ignored
+Import One,Writer A,First,fiction,novel,2001,x
+Import Two,Writer B,,fantasy,,1999,x
+  ,Writer C,,fiction,novel,2000,x
+Import Four,Writer D,,not_a_genre,novel,2000,x
+Import Five,Writer E,,sci_fi,poetry,3000,x
+Import Six,Writer F,,,,,x
+"""
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a CSV file with valid and invalid rows"""
+    path = tmp_path / 'books.csv'
+    path.write_text(CSV_ROWS)
+    return path
+
+
+def run_import(path, *args):
+    call_command('import_books', str(path), *args, stdout=StringIO())
+
+
+class TestImportBooksCommand:
+    """Tests for the import_books management command"""
+
+    def test_imports_valid_csv_rows(self, csv_file):
+        """Valid rows are inserted with their values"""
+        run_import(csv_file, '--batch-size', '2')
+        imported = Book.objects.filter(title__startswith='Import').order_by('title')
+        assert [b.title for b in imported] == ['Import One', 'Import Six', 'Import Two']
+        one = imported.get(title='Import One')
+        assert (one.author, one.genre, one.book_type, one.published_year) == ('Writer A', 'fiction', 'novel', 2001)
+        six = imported.get(title='Import Six')
+        assert (six.genre, six.book_type, six.published_year) == (None, None, None)
+
+    def test_rejected_rows_are_reported(self, csv_file, tmp_path):
+        """Rows that fail validation are written to the rejects file with their errors"""
+        rejects = tmp_path / 'rejects.jsonl'
+        run_import(csv_file, '--rejects', str(rejects))
+        errors = {r['row']: r['errors'] for r in map(json.loads, rejects.read_text().splitlines())}
+        assert set(errors) == {3, 4, 5}
+        assert 'title' in errors[3]
+        assert 'genre' in errors[4]
+        assert 'published_year' in errors[5]
+
+    def test_imports_jsonl(self, tmp_path):
+        """JSONL files are imported line by line"""
+        path = tmp_path / 'books.jsonl'
+        path.write_text(
+            json.dumps({'title': 'Jsonl Book', 'author': 'Writer', 'published_year': 2010}) + '\n'
+            + 'not json\n'
+        )
+        rejects = tmp_path / 'rejects.jsonl'
+        run_import(path, '--rejects', str(rejects))
+        assert Book.objects.filter(title='Jsonl Book', published_year=2010).exists()
+        assert json.loads(rejects.read_text())['row'] == 2
+
+    def test_resume_skips_committed_rows(self, csv_file, tmp_path):
+        """A resumed import continues after the checkpointed row"""
+        checkpoint = tmp_path / 'books.checkpoint'
+        checkpoint.write_text(json.dumps({'rows': 2}))
+        run_import(csv_file, '--checkpoint', str(checkpoint), '--resume')
+        titles = set(Book.objects.filter(title__startswith='Import').values_list('title', flat=True))
+        assert titles == {'Import Six'}
+        assert json.loads(checkpoint.read_text()) == {'rows': 6}
+
+    def test_checkpoint_is_written_after_import(self, csv_file):
+        """The default checkpoint records every processed row"""
+        run_import(csv_file)
+        checkpoint = csv_file.parent / 'books.csv.checkpoint'
+        assert json.loads(checkpoint.read_text()) == {'rows': 6}
+
+    def test_missing_file_raises_error(self, tmp_path):
+        """Importing a missing file fails cleanly"""
+        with pytest.raises(CommandError):
+            run_import(tmp_path / 'missing.csv')
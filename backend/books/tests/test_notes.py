@@ -153,6 +153,15 @@ class TestBookNotesListAPIView:
         response = authenticated_client.post(f'/api/books/{nonexistent_id}/notes/', note_data, format='json')
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_list_notes_with_sparse_fields(self, authenticated_client, user_note, book,
+                                           django_assert_max_num_queries):
+        """?exclude=note drops note bodies from the output and the query"""
+        with django_assert_max_num_queries(5) as captured:
+            response = authenticated_client.get(f'/api/books/{book.id}/notes/?exclude=note')
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data[0]) == {'id', 'book', 'created_at', 'updated_at'}
+        assert '"books_usernote"."note"' not in captured.captured_queries[-1]['sql']
+
 
 class TestBookNoteDetailAPIView:
     """Tests for retrieving, updating, and deleting individual notes"""
@@ -0,0 +1,156 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework import status
+from books.models import Book
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Create an API client for making requests"""
+    return APIClient()
+
+
+@pytest.fixture
+def books_with_ties():
+    """Create books sharing sort values, including missing published years"""
+    books = []
+    for i in range(5):
+        books.append(Book.objects.create(title=f'Keyset {i}', author='Same Author', published_year=2001))
+        books.append(Book.objects.create(title=f'Keyset {i}', author='Same Author', published_year=None))
+    return books
+
+
+def walk(client, url, direction='next'):
+    """Follow cursor links and return the visited pages"""
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        url = response.data[direction]
+    return pages
+
+
+class TestBookKeysetPagination:
+    """Tests for the opt-in cursor pagination mode of the book list"""
+
+    def test_cursor_mode_returns_cursor_metadata_without_count(self, api_client, books_with_ties):
+        """Cursor mode omits count metadata and links to the next page"""
+        response = api_client.get('/api/books/?pagination=cursor&page_size=5')
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        assert 'total_pages' not in response.data
+        assert response.data['previous'] is None
+        assert 'cursor=' in response.data['next']
+        assert len(response.data['results']) == 5
+
+    def test_cursor_mode_does_not_run_count_query(self, api_client, books_with_ties, django_assert_max_num_queries):
+        """Fetching a cursor page never runs COUNT(*)"""
+        first = api_client.get('/api/books/?pagination=cursor&page_size=5')
+        with django_assert_max_num_queries(10) as captured:
+            api_client.get(first.data['next'])
+        assert all('COUNT(' not in query['sql'].upper() for query in captured.captured_queries)
+
+    @pytest.mark.parametrize('ordering', [
+        'title', '-title', 'author', '-author', 'published_year', '-published_year', 'created_at', '-created_at',
+    ])
+    def test_walking_cursors_visits_every_book_once_in_order(self, api_client, books_with_ties, ordering):
+        """Following next links covers the whole list in order for every ordering field"""
+        pages = walk(api_client, f'/api/books/?pagination=cursor&page_size=4&ordering={ordering}')
+        ids = [b['id'] for page in pages for b in page['results']]
+        assert len(ids) == len(set(ids)) == Book.objects.count()
+
+        name = ordering.lstrip('-')
+        expected = sorted(
+            Book.objects.all(),
+            key=lambda b: (getattr(b, name) is None, getattr(b, name) or 0, b.id),
+        )
+        if ordering.startswith('-'):
+            expected.reverse()
+        assert ids == [b.id for b in expected]
+
+    def test_previous_link_returns_previous_page(self, api_client, books_with_ties):
+        """Following previous from the second page returns the first page"""
+        first = api_client.get('/api/books/?pagination=cursor&page_size=3&ordering=-published_year')
+        second = api_client.get(first.data['next'])
+        back = api_client.get(second.data['previous'])
+        assert [b['id'] for b in back.data['results']] == [b['id'] for b in first.data['results']]
+        assert back.data['previous'] is None
+
+    def test_cursor_respects_filters(self, api_client, books_with_ties):
+        """Filters and search still apply in cursor mode"""
+        pages = walk(api_client, '/api/books/?pagination=cursor&page_size=3&search=Keyset')
+        ids = {b['id'] for page in pages for b in page['results']}
+        assert ids == {b.id for b in books_with_ties}
+
+    def test_invalid_cursor_returns_not_found(self, api_client):
+        """A malformed cursor is rejected"""
+        response = api_client.get('/api/books/?cursor=not-a-cursor')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_cursor_from_other_ordering_is_rejected(self, api_client, books_with_ties):
+        """A cursor issued for one ordering cannot be replayed with another"""
+        first = api_client.get('/api/books/?pagination=cursor&page_size=3&ordering=title')
+        cursor = first.data['next'].split('cursor=')[1].split('&')[0]
+        response = api_client.get(f'/api/books/?cursor={cursor}&ordering=author')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_page_number_mode_is_default(self, api_client, books_with_ties):
+        """Without opting in, the list keeps page number pagination"""
+        response = api_client.get('/api/books/')
+        assert 'count' in response.data
+        assert 'current_page' in response.data
+
+
+def count_queries(captured):
+    return [q['sql'] for q in captured.captured_queries if 'COUNT(' in q['sql'].upper()]
+
+
+class TestBookCountStrategy:
+    """Tests for exact, cached and estimated list counts"""
+
+    def test_small_result_sets_use_exact_count(self, api_client, books_with_ties, settings):
+        """Counts under the threshold are exact"""
+        settings.BOOK_COUNT_EXACT_THRESHOLD = 1000
+        response = api_client.get('/api/books/')
+        assert response.data['count_type'] == 'exact'
+        assert response.data['count'] == Book.objects.count()
+
+    def test_large_result_sets_use_cached_count(self, api_client, books_with_ties, settings,
+                                                django_assert_max_num_queries):
+        """Above the threshold the full count runs once and is then served from cache"""
+        settings.BOOK_COUNT_EXACT_THRESHOLD = 3
+        with django_assert_max_num_queries(50) as first:
+            response = api_client.get('/api/books/?search=Keyset')
+        assert response.data['count_type'] == 'cached'
+        assert response.data['count'] == len(books_with_ties)
+        assert len(count_queries(first)) == 2
+
+        with django_assert_max_num_queries(50) as second:
+            response = api_client.get('/api/books/?search=Keyset&page=2&page_size=4&ordering=-title')
+        assert response.data['count'] == len(books_with_ties)
+        assert len(count_queries(second)) == 1
+
+    def test_cached_count_is_invalidated_when_a_book_changes(self, api_client, books_with_ties, settings):
+        """Saving or deleting a book invalidates cached counts"""
+        settings.BOOK_COUNT_EXACT_THRESHOLD = 3
+        api_client.get('/api/books/?search=Keyset')
+
+        Book.objects.create(title='Keyset extra', author='Same Author')
+        response = api_client.get('/api/books/?search=Keyset')
+        assert response.data['count'] == len(books_with_ties) + 1
+
+        books_with_ties[0].delete()
+        response = api_client.get('/api/books/?search=Keyset')
+        assert response.data['count'] == len(books_with_ties)
+
+    def test_estimate_strategy_falls_back_to_cache_without_planner_estimates(self, api_client, books_with_ties,
+                                                                            settings):
+        """SQLite has no planner row estimates, so the cached count is used"""
+        settings.BOOK_COUNT_EXACT_THRESHOLD = 3
+        settings.BOOK_COUNT_STRATEGY = 'estimate'
+        response = api_client.get('/api/books/?search=Keyset')
+        assert response.data['count_type'] == 'cached'
+        assert response.data['count'] == len(books_with_ties)
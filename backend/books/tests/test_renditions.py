@@ -0,0 +1,123 @@
+import io
+import os
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+from books.models import Book
+from books.renditions import generate_renditions
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def authenticated_client():
+    """Create an authenticated API client"""
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='covers', password='testpass123'))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def media_settings(settings, tmp_path):
+    """Store uploads in a temporary directory and render inline"""
+    settings.MEDIA_ROOT = tmp_path
+    settings.BOOK_COVER_RENDITION_WIDTHS = [160, 320]
+    settings.BOOK_COVER_RENDITION_WORKERS = 0
+    return settings
+
+
+def cover_upload(name='cover.png', size=(600, 900), mode='RGBA'):
+    """Return an uploaded PNG of the given size"""
+    buffer = io.BytesIO()
+    Image.new(mode, size, (200, 40, 40, 255) if mode == 'RGBA' else (200, 40, 40)).save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+def upload_book(client, django_capture_on_commit_callbacks, **data):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post('/api/books/', {
+            'title': 'Covered', 'author': 'Painter', 'cover_image': cover_upload(), **data,
+        }, format='multipart')
+    assert response.status_code == status.HTTP_201_CREATED
+    return Book.objects.get(id=response.data['id'])
+
+
+class TestCoverRenditions:
+    """Tests for generated cover thumbnails"""
+
+    def test_upload_generates_renditions_per_width_and_format(self, authenticated_client, media_settings,
+                                                               django_capture_on_commit_callbacks):
+        """Each configured width gets a JPEG and a WebP rendition, scaled down"""
+        book = upload_book(authenticated_client, django_capture_on_commit_callbacks)
+        assert set(book.cover_renditions) == {'160', '320'}
+        for width, formats in book.cover_renditions.items():
+            assert set(formats) == {'jpeg', 'webp'}
+            for output_format, name in formats.items():
+                with Image.open(media_settings.MEDIA_ROOT / name) as image:
+                    assert image.format == output_format.upper()
+                    assert image.size == (int(width), int(width) * 3 // 2)
+
+    def test_renditions_have_content_hashed_names(self, authenticated_client, django_capture_on_commit_callbacks):
+        """Rendering again yields the same names, so URLs can be cached forever"""
+        book = upload_book(authenticated_client, django_capture_on_commit_callbacks)
+        name = book.cover_renditions['160']['webp']
+        stem = os.path.splitext(os.path.basename(book.cover_image.name))[0]
+        assert name.startswith(f'book_covers/renditions/{stem}-160w.')
+        assert generate_renditions(book.id) == book.cover_renditions
+
+    def test_detail_exposes_rendition_urls(self, authenticated_client, django_capture_on_commit_callbacks):
+        """The serializer returns absolute rendition URLs"""
+        book = upload_book(authenticated_client, django_capture_on_commit_callbacks)
+        response = APIClient().get(f'/api/books/{book.id}/')
+        url = response.data['cover_renditions']['320']['jpeg']
+        assert url == f"http://testserver/media/{book.cover_renditions['320']['jpeg']}"
+
+    def test_replacing_cover_regenerates_renditions(self, authenticated_client, django_capture_on_commit_callbacks):
+        """A new cover replaces the renditions of the old one"""
+        book = upload_book(authenticated_client, django_capture_on_commit_callbacks)
+        old = book.cover_renditions
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.patch(f'/api/books/{book.id}/', {
+                'cover_image': cover_upload('other.png', size=(400, 400), mode='RGB'),
+            }, format='multipart')
+        assert response.status_code == status.HTTP_200_OK
+        book.refresh_from_db()
+        stem = os.path.splitext(os.path.basename(book.cover_image.name))[0]
+        assert book.cover_renditions['160']['jpeg'] != old['160']['jpeg']
+        assert book.cover_renditions['160']['jpeg'].startswith(f'book_covers/renditions/{stem}-')
+
+    def test_books_without_cover_have_no_renditions(self, authenticated_client, django_capture_on_commit_callbacks):
+        """Nothing is rendered without a cover"""
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            response = authenticated_client.post('/api/books/', {'title': 'Bare', 'author': 'Nobody'}, format='json')
+        assert response.data['cover_renditions'] == {}
+        assert all('renditions' not in callback.__module__ for callback in callbacks)
+
+    def test_small_covers_are_not_upscaled(self, authenticated_client, media_settings,
+                                           django_capture_on_commit_callbacks):
+        """Covers narrower than a rendition width keep their size"""
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post('/api/books/', {
+                'title': 'Tiny', 'author': 'Small', 'cover_image': cover_upload(size=(100, 150)),
+            }, format='multipart')
+        book = Book.objects.get(id=response.data['id'])
+        with Image.open(media_settings.MEDIA_ROOT / book.cover_renditions['320']['jpeg']) as image:
+            assert image.size == (100, 150)
+
+    def test_command_backfills_missing_renditions(self, authenticated_client, django_capture_on_commit_callbacks):
+        """generate_cover_renditions fills in covers that have none"""
+        book = upload_book(authenticated_client, django_capture_on_commit_callbacks)
+        expected = book.cover_renditions
+        Book.objects.filter(id=book.id).update(cover_renditions={})
+        out = io.StringIO()
+        call_command('generate_cover_renditions', stdout=out)
+        book.refresh_from_db()
+        assert book.cover_renditions == expected
+        assert 'Generated renditions for 1 book(s)' in out.getvalue()
@@ -0,0 +1,85 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework import status
+from books.models import Book
+from books.search import SQLiteFTS5Backend, get_search_backend
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def api_client():
+    """Create an API client for making requests"""
+    return APIClient()
+
+
+@pytest.fixture
+def searchable_books():
+    """Create books that match 'zephyr' in different fields"""
+    return {
+        'title': Book.objects.create(title='Zephyrine Winds', author='Anna Quill'),
+        'author': Book.objects.create(title='Quiet Harbour', author='Zephyr Stone'),
+        'description': Book.objects.create(
+            title='Night Garden', author='Mira Vale', description='A story carried by the zephyr.'
+        ),
+    }
+
+
+def search_ids(client, query):
+    response = client.get('/api/books/', {'search': query, 'page_size': 100})
+    assert response.status_code == status.HTTP_200_OK
+    return [b['id'] for b in response.data['results']]
+
+
+class TestBookFullTextSearch:
+    """Tests for the full-text search backend behind ?search="""
+
+    def test_sqlite_uses_fts5_backend(self):
+        """The FTS5 table is created by migrations and picked automatically"""
+        assert isinstance(get_search_backend(), SQLiteFTS5Backend)
+
+    def test_terms_match_as_prefixes(self, api_client, searchable_books):
+        """Partial words match the start of title and author words"""
+        ids = search_ids(api_client, 'zeph')
+        assert searchable_books['title'].id in ids
+        assert searchable_books['author'].id in ids
+
+    def test_results_are_ranked_by_relevance(self, api_client, searchable_books):
+        """Title matches rank above author matches when no ordering is given"""
+        ids = search_ids(api_client, 'zephyr')
+        assert ids.index(searchable_books['title'].id) < ids.index(searchable_books['author'].id)
+
+    def test_explicit_ordering_overrides_rank(self, api_client, searchable_books):
+        """An ordering parameter takes precedence over relevance"""
+        response = api_client.get('/api/books/', {'search': 'zephyr', 'ordering': '-title'})
+        titles = [b['title'] for b in response.data['results']]
+        assert titles == sorted(titles, reverse=True)
+
+    def test_description_is_only_searched_on_request(self, api_client, searchable_books):
+        """Description matches require search_description=true"""
+        assert searchable_books['description'].id not in search_ids(api_client, 'zephyr')
+        response = api_client.get('/api/books/', {'search': 'zephyr', 'search_description': 'true'})
+        ids = [b['id'] for b in response.data['results']]
+        assert searchable_books['description'].id in ids
+
+    def test_index_follows_updates_and_deletes(self, api_client, searchable_books):
+        """The index stays consistent when books are updated or deleted"""
+        book = searchable_books['title']
+        book.title = 'Still Waters'
+        book.save()
+        assert book.id not in search_ids(api_client, 'zephyrine')
+        assert book.id in search_ids(api_client, 'still waters')
+
+        book.delete()
+        assert search_ids(api_client, 'still waters') == []
+
+    def test_search_syntax_characters_are_ignored(self, api_client, searchable_books):
+        """Quotes and operators in the query cannot break the match expression"""
+        ids = search_ids(api_client, '"zephyr*:(')
+        assert searchable_books['title'].id in ids
+
+    def test_like_backend_can_be_configured(self, api_client, searchable_books, settings):
+        """BOOK_SEARCH_BACKEND selects another backend"""
+        settings.BOOK_SEARCH_BACKEND = 'books.search.LikeSearchBackend'
+        ids = search_ids(api_client, 'ephyr')
+        assert searchable_books['title'].id in ids
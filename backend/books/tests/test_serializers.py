@@ -0,0 +1,48 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+from books.models import Book
+from books.serializers import BookSerializer, FastListRepresentation
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def varied_books():
+    """Create books covering empty, null and file values"""
+    return [
+        Book.objects.create(
+            title='Fast Path', author='Writer', description='Ünïcode “quotes”', genre='fiction',
+            book_type='poetry', published_year=1999, cover_image='book_covers/fast.jpg',
+        ),
+        Book.objects.create(title='Fast Path Two', author='Writer', cover_image=''),
+        Book.objects.create(title='Fast Path Three', author='Writer', published_year=0),
+    ]
+
+
+class TestFastListRepresentation:
+    """Tests for the dict-based list representation of books"""
+
+    def test_output_is_byte_identical_to_book_serializer(self, varied_books):
+        """Rendering values() rows gives the same JSON bytes as BookSerializer"""
+        request = APIRequestFactory().get('/api/books/')
+        context = {'request': request}
+        queryset = Book.objects.filter(id__in=[b.id for b in varied_books]).order_by('id')
+
+        expected = JSONRenderer().render(BookSerializer(queryset, many=True, context=context).data)
+        representation = FastListRepresentation(BookSerializer, context)
+        actual = JSONRenderer().render(representation.to_representation(queryset.values(*representation.sources)))
+        assert actual == expected
+
+    def test_list_endpoint_matches_serializer_output(self, varied_books):
+        """The list endpoint returns exactly what BookSerializer would"""
+        response = APIClient().get('/api/books/?search=fast path&ordering=title')
+        request = response.wsgi_request
+        books = sorted(varied_books, key=lambda b: b.title)
+        expected = BookSerializer(books, many=True, context={'request': request}).data
+        assert response.content.count(JSONRenderer().render(expected)) == 1
+
+    def test_list_page_is_fetched_with_a_single_query(self, varied_books, django_assert_num_queries):
+        """Listing a page costs one bounded count and one page query"""
+        with django_assert_num_queries(2):
+            APIClient().get('/api/books/?ordering=title')
@@ -0,0 +1,144 @@
+import io
+import os
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+from books.models import Book
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+PNG = (
+    b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89'
+    b'\x00\x00\x00\rIDATx\x9cc\xf8\xcf\xc0\xf0\x1f\x00\x05\x00\x01\xff\x89\x99=\x1d\x00\x00\x00\x00IEND\xaeB`\x82'
+)
+
+
+@pytest.fixture
+def authenticated_client():
+    """Create an authenticated API client"""
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create_user(username='storage', password='testpass123'))
+    return client
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Store uploads in a temporary directory without rendering thumbnails"""
+    settings.MEDIA_ROOT = tmp_path
+    settings.BOOK_COVER_RENDITION_WIDTHS = []
+    settings.BOOK_COVER_RENDITION_WORKERS = 0
+    return tmp_path
+
+
+def upload(client, title, name='cover.png', content=PNG):
+    response = client.post('/api/books/', {
+        'title': title, 'author': 'Author', 'cover_image': SimpleUploadedFile(name, content, 'image/png'),
+    }, format='multipart')
+    assert response.status_code == status.HTTP_201_CREATED
+    return Book.objects.get(id=response.data['id'])
+
+
+def stored_files(root):
+    return sorted(
+        os.path.relpath(os.path.join(directory, name), root)
+        for directory, _, names in os.walk(root) for name in names
+    )
+
+
+class TestContentAddressedStorage:
+    """Tests for deduplicated cover storage"""
+
+    def test_identical_uploads_share_one_blob(self, authenticated_client, media_root):
+        """Uploading the same file twice stores it once, named by its hash"""
+        first = upload(authenticated_client, 'First edition', 'first.png')
+        second = upload(authenticated_client, 'Second edition', 'second.png')
+        assert first.cover_image.name == second.cover_image.name
+        digest = os.path.splitext(os.path.basename(first.cover_image.name))[0]
+        assert first.cover_image.name == f'book_covers/{digest[:2]}/{digest}.png'
+        assert stored_files(media_root) == [first.cover_image.name]
+
+    def test_deleting_a_book_keeps_shared_blob(self, authenticated_client, media_root,
+                                               django_capture_on_commit_callbacks):
+        """A blob is only removed when its last book is deleted"""
+        first = upload(authenticated_client, 'First edition')
+        second = upload(authenticated_client, 'Second edition')
+        path = media_root / first.cover_image.name
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.delete(f'/api/books/{first.id}/')
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert path.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.delete(f'/api/books/{second.id}/')
+        assert not path.exists()
+
+    def test_replacing_a_cover_releases_the_old_blob(self, authenticated_client, media_root,
+                                                     django_capture_on_commit_callbacks):
+        """The previous cover is deleted once no book references it"""
+        book = upload(authenticated_client, 'Edition')
+        old_path = media_root / book.cover_image.name
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.patch(f'/api/books/{book.id}/', {
+                'cover_image': SimpleUploadedFile('new.png', PNG + b'\x00', 'image/png'),
+            }, format='multipart')
+        book.refresh_from_db()
+        assert not old_path.exists()
+        assert (media_root / book.cover_image.name).exists()
+
+    def test_storage_save_streams_content(self, media_root):
+        """Saving through the storage hashes the content it writes"""
+        storage = Book._meta.get_field('cover_image').storage
+        name = storage.save('book_covers/x.PNG', ContentFile(PNG))
+        assert storage.is_blob(name) and name.endswith('.png')
+        assert storage.digest(name) == os.path.splitext(os.path.basename(name))[0]
+
+
+class TestDedupeCoversCommand:
+    """Tests for the dedupe_covers management command"""
+
+    @pytest.fixture
+    def legacy_covers(self, media_root):
+        """Books pointing at plain, duplicated cover files"""
+        directory = media_root / 'book_covers'
+        directory.mkdir()
+        for name in ('a.png', 'b.png'):
+            (directory / name).write_bytes(PNG)
+        (directory / 'c.png').write_bytes(PNG + b'\x00')
+        return [
+            Book.objects.create(title=f'Legacy {name}', author='Author', cover_image=f'book_covers/{name}')
+            for name in ('a.png', 'a.png', 'b.png', 'c.png')
+        ]
+
+    def test_dedupe_merges_identical_files(self, legacy_covers, media_root):
+        """Identical files become one blob and the old copies are removed"""
+        out = io.StringIO()
+        call_command('dedupe_covers', stdout=out)
+        names = {book.id: Book.objects.get(id=book.id).cover_image.name for book in legacy_covers}
+        a, a_again, b, c = (names[book.id] for book in legacy_covers)
+        assert a == a_again == b != c
+        assert stored_files(media_root) == sorted([a, c])
+        assert f'merged 1 duplicate(s) ({len(PNG)} bytes reclaimed)' in out.getvalue()
+
+    def test_dry_run_changes_nothing(self, legacy_covers, media_root):
+        """--dry-run only reports"""
+        before = stored_files(media_root)
+        out = io.StringIO()
+        call_command('dedupe_covers', '--dry-run', stdout=out)
+        assert stored_files(media_root) == before
+        assert Book.objects.filter(cover_image='book_covers/a.png').count() == 2
+        assert 'Would move 2 cover(s)' in out.getvalue()
+
+    def test_dedupe_is_idempotent(self, legacy_covers, media_root):
+        """Running again finds nothing left to do"""
+        call_command('dedupe_covers', stdout=io.StringIO())
+        out = io.StringIO()
+        call_command('dedupe_covers', stdout=out)
+        assert 'Moved 0 cover(s) into blobs and merged 0 duplicate(s)' in out.getvalue()
@@ -1,3 +1,7 @@
+import csv
+import io
+import json
+
 import pytest
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -312,3 +316,360 @@ class TestBookChoicesAPIView:
         """Choices endpoint is accessible without authentication"""
         response = api_client.get('/api/books/choices/')
         assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.fixture
+def suggest_index():
+    """Reset the in-memory typeahead index around each test"""
+    from books.suggest import suggest_index
+    suggest_index.reset()
+    yield suggest_index
+    suggest_index.reset()
+
+
+class TestBookSuggestAPIView:
+    """Tests for the typeahead suggestions endpoint"""
+
+    def test_suggest_completes_titles_and_authors(self, api_client, multiple_books, suggest_index):
+        """Prefixes complete both titles and authors"""
+        response = api_client.get('/api/books/suggest/?q=book t')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == [
+            {'value': 'Book Three', 'field': 'title'},
+            {'value': 'Book Two', 'field': 'title'},
+        ]
+
+    def test_suggest_matches_later_words(self, api_client, multiple_books, suggest_index):
+        """A prefix can match any word of a title or author"""
+        response = api_client.get('/api/books/suggest/?q=TWO')
+        assert {'value': 'Author Two', 'field': 'author'} in response.data['results']
+        assert {'value': 'Book Two', 'field': 'title'} in response.data['results']
+
+    def test_suggest_does_not_query_database_once_built(self, api_client, multiple_books, suggest_index,
+                                                       django_assert_num_queries):
+        """Lookups are served from memory after the index is built"""
+        api_client.get('/api/books/suggest/?q=book')
+        with django_assert_num_queries(0):
+            response = api_client.get('/api/books/suggest/?q=author')
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_suggest_respects_limit(self, api_client, multiple_books, suggest_index):
+        """The number of suggestions is capped by limit"""
+        response = api_client.get('/api/books/suggest/?q=book&limit=2')
+        assert len(response.data['results']) == 2
+
+    def test_suggest_follows_book_changes(self, api_client, book, suggest_index,
+                                         django_capture_on_commit_callbacks):
+        """Saved and deleted books update the index incrementally"""
+        api_client.get('/api/books/suggest/?q=test')
+        with django_capture_on_commit_callbacks(execute=True):
+            book.title = 'Renamed Volume'
+            book.save()
+        response = api_client.get('/api/books/suggest/?q=renamed')
+        assert response.data['results'] == [{'value': 'Renamed Volume', 'field': 'title'}]
+        assert {'value': 'Test Book', 'field': 'title'} not in \
+            api_client.get('/api/books/suggest/?q=test').data['results']
+
+        with django_capture_on_commit_callbacks(execute=True):
+            book.delete()
+        assert api_client.get('/api/books/suggest/?q=renamed').data['results'] == []
+
+
+class TestConditionalGet:
+    """Tests for ETag / Last-Modified handling on read endpoints"""
+
+    def test_detail_returns_304_for_matching_etag(self, api_client, book, django_assert_num_queries):
+        """A matching If-None-Match short-circuits with a single lookup"""
+        response = api_client.get(f'/api/books/{book.id}/')
+        assert response.has_header('ETag')
+        assert response.has_header('Last-Modified')
+        with django_assert_num_queries(1):
+            cached = api_client.get(f'/api/books/{book.id}/', HTTP_IF_NONE_MATCH=response['ETag'])
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_detail_etag_changes_when_book_is_updated(self, api_client, book):
+        """Updating a book invalidates its ETag"""
+        etag = api_client.get(f'/api/books/{book.id}/')['ETag']
+        book.title = 'Changed'
+        book.save()
+        response = api_client.get(f'/api/books/{book.id}/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['title'] == 'Changed'
+
+    def test_detail_honours_if_modified_since(self, api_client, book):
+        """If-Modified-Since at or after the last update returns 304"""
+        last_modified = api_client.get(f'/api/books/{book.id}/')['Last-Modified']
+        response = api_client.get(f'/api/books/{book.id}/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_list_etag_depends_on_query_and_catalog(self, api_client, multiple_books):
+        """List ETags vary by query parameters and change when the catalog changes"""
+        etag = api_client.get('/api/books/?genre=fantasy')['ETag']
+        assert api_client.get('/api/books/?genre=fantasy', HTTP_IF_NONE_MATCH=etag).status_code == \
+            status.HTTP_304_NOT_MODIFIED
+        assert api_client.get('/api/books/?genre=fiction', HTTP_IF_NONE_MATCH=etag).status_code == \
+            status.HTTP_200_OK
+
+        Book.objects.create(title='Another Fantasy', author='Someone', genre='fantasy')
+        assert api_client.get('/api/books/?genre=fantasy', HTTP_IF_NONE_MATCH=etag).status_code == \
+            status.HTTP_200_OK
+
+    def test_choices_returns_304_for_matching_etag(self, api_client):
+        """Choices use a constant ETag"""
+        etag = api_client.get('/api/books/choices/')['ETag']
+        response = api_client.get('/api/books/choices/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+class TestBookListResponseCache:
+    """Tests for the anonymous book list response cache"""
+
+    def test_repeated_anonymous_requests_hit_the_cache(self, api_client, multiple_books,
+                                                       django_assert_num_queries):
+        """The second identical request is served without touching the database"""
+        first = api_client.get('/api/books/?genre=fantasy&ordering=title')
+        assert first['X-Cache'] == 'MISS'
+        with django_assert_num_queries(0):
+            second = api_client.get('/api/books/?ordering=title&genre=fantasy')
+        assert second['X-Cache'] == 'HIT'
+        assert second.data == first.data
+
+    def test_page_size_is_clamped_in_the_cache_key(self, api_client, multiple_books):
+        """page_size values above the maximum share one cache entry"""
+        api_client.get('/api/books/?page_size=100')
+        assert api_client.get('/api/books/?page_size=500')['X-Cache'] == 'HIT'
+
+    def test_book_changes_invalidate_cached_lists(self, api_client, authenticated_client, book):
+        """Updating a book through the API invalidates cached lists"""
+        api_client.get('/api/books/?search=Test Book')
+        authenticated_client.patch(f'/api/books/{book.id}/', {'title': 'Test Book Revised'}, format='json')
+        response = api_client.get('/api/books/?search=Test Book')
+        assert response['X-Cache'] == 'MISS'
+        assert response.data['results'][0]['title'] == 'Test Book Revised'
+
+    def test_authenticated_requests_bypass_the_cache(self, authenticated_client, multiple_books):
+        """Only anonymous traffic is cached"""
+        authenticated_client.get('/api/books/')
+        response = authenticated_client.get('/api/books/')
+        assert not response.has_header('X-Cache')
+
+    def test_cache_stats_require_admin(self, api_client, authenticated_client, multiple_books):
+        """Hit/miss counters are only visible to admins"""
+        assert authenticated_client.get('/api/books/cache-stats/').status_code == status.HTTP_403_FORBIDDEN
+
+        admin = User.objects.create_superuser(username='admin', password='adminpass123')
+        admin_client = APIClient()
+        admin_client.force_authenticate(user=admin)
+        api_client.get('/api/books/')
+        api_client.get('/api/books/')
+        response = admin_client.get('/api/books/cache-stats/')
+        assert response.data['hits'] == 1
+        assert response.data['misses'] == 1
+
+
+class TestBookBulkAPIView:
+    """Tests for bulk create/update/delete of books"""
+
+    def test_bulk_requires_authentication(self, api_client):
+        """Bulk operations require authentication"""
+        response = api_client.post('/api/books/bulk/', [], format='json')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_bulk_applies_mixed_operations(self, authenticated_client, multiple_books):
+        """Creates, updates and deletes are applied and reported per item"""
+        keep, change, remove = multiple_books
+        operations = [
+            {'op': 'create', 'data': {'title': 'Bulk New', 'author': 'Bulk Author', 'genre': 'fiction'}},
+            {'op': 'update', 'id': change.id, 'data': {'title': '  Bulk Renamed  ', 'published_year': 2000}},
+            {'op': 'delete', 'id': remove.id},
+        ]
+        response = authenticated_client.post('/api/books/bulk/', operations, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data['results']
+        assert [r['status'] for r in results] == ['created', 'updated', 'deleted']
+
+        created = Book.objects.get(id=results[0]['id'])
+        assert (created.title, created.author, created.genre) == ('Bulk New', 'Bulk Author', 'fiction')
+        change.refresh_from_db()
+        assert (change.title, change.published_year, change.author) == ('Bulk Renamed', 2000, 'Author Two')
+        assert not Book.objects.filter(id=remove.id).exists()
+        assert Book.objects.filter(id=keep.id).exists()
+
+    def test_bulk_uses_constant_number_of_queries(self, authenticated_client, multiple_books,
+                                                  django_assert_max_num_queries):
+        """Many operations are applied with a bounded number of queries"""
+        operations = [{'op': 'create', 'data': {'title': f'Bulk {i}', 'author': 'Bulk'}} for i in range(50)]
+        operations += [{'op': 'update', 'id': b.id, 'data': {'genre': 'biography'}} for b in multiple_books]
+        with django_assert_max_num_queries(10):
+            response = authenticated_client.post('/api/books/bulk/', operations, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert Book.objects.filter(author='Bulk').count() == 50
+        assert set(Book.objects.filter(id__in=[b.id for b in multiple_books]).values_list('genre', flat=True)) == \
+            {'biography'}
+
+    def test_bulk_rejects_everything_when_one_item_is_invalid(self, authenticated_client, book):
+        """Validation errors are reported per item and nothing is written"""
+        operations = [
+            {'op': 'create', 'data': {'title': 'Valid Bulk Book', 'author': 'Author'}},
+            {'op': 'create', 'data': {'title': '   ', 'author': 'Author'}},
+            {'op': 'update', 'id': 999999, 'data': {'title': 'Missing'}},
+            {'op': 'update', 'id': book.id, 'data': {'published_year': 3000}},
+            {'op': 'rename', 'id': book.id},
+        ]
+        response = authenticated_client.post('/api/books/bulk/', operations, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.data['error']['details']['operations']
+        assert errors[0] == {}
+        assert 'title' in errors[1]
+        assert 'id' in errors[2]
+        assert 'published_year' in errors[3]
+        assert 'op' in errors[4]
+        assert not Book.objects.filter(title='Valid Bulk Book').exists()
+
+    def test_bulk_enforces_maximum_operations(self, authenticated_client, settings):
+        """Requests above the configured limit are rejected"""
+        settings.BOOK_BULK_MAX_OPERATIONS = 2
+        operations = [{'op': 'create', 'data': {'title': 'T', 'author': 'A'}}] * 3
+        response = authenticated_client.post('/api/books/bulk/', operations, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def streamed_text(response):
+    return b''.join(response.streaming_content).decode()
+
+
+class TestBookExportAPIView:
+    """Tests for the streaming catalog export"""
+
+    def test_export_requires_authentication(self, api_client):
+        """Exporting the catalog requires authentication"""
+        response = api_client.get('/api/books/export/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_export_streams_ndjson_by_default(self, authenticated_client, multiple_books):
+        """Every book is streamed as one JSON object per line"""
+        response = authenticated_client.get('/api/books/export/')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response['Content-Type'].startswith('application/x-ndjson')
+        records = [json.loads(line) for line in streamed_text(response).splitlines()]
+        assert len(records) == Book.objects.count()
+        by_id = {r['id']: r for r in records}
+        book = multiple_books[0]
+        detail = authenticated_client.get(f'/api/books/{book.id}/').data
+        detail.pop('cover_renditions')  # derived from cover_image, not exported
+        assert by_id[book.id] == json.loads(json.dumps(detail))
+
+    def test_export_streams_csv(self, authenticated_client, multiple_books):
+        """?format=csv streams a header row followed by one row per book"""
+        response = authenticated_client.get('/api/books/export/?format=csv')
+        assert response['Content-Type'].startswith('text/csv')
+        rows = list(csv.DictReader(io.StringIO(streamed_text(response))))
+        assert len(rows) == Book.objects.count()
+        assert {'Book One', 'Book Two', 'Book Three'} <= {r['title'] for r in rows}
+
+    def test_export_honours_filters_and_search(self, authenticated_client, multiple_books):
+        """The list endpoint's filters and search apply to the export"""
+        response = authenticated_client.get('/api/books/export/?genre=fantasy')
+        titles = [json.loads(line)['title'] for line in streamed_text(response).splitlines()]
+        assert 'Book Two' in titles
+        assert all(r == 'fantasy' for r in Book.objects.filter(title__in=titles).values_list('genre', flat=True))
+
+        response = authenticated_client.get('/api/books/export/?search=Author Three')
+        titles = [json.loads(line)['title'] for line in streamed_text(response).splitlines()]
+        assert titles == ['Book Three']
+
+
+class TestBookListFacets:
+    """Tests for facet counts on the book list"""
+
+    def test_list_without_facets_param_has_no_facets(self, api_client, multiple_books):
+        """Facets are only computed on request"""
+        response = api_client.get('/api/books/')
+        assert 'facets' not in response.data
+
+    def test_facets_count_values_in_current_context(self, api_client, multiple_books):
+        """Facet counts follow the active search"""
+        response = api_client.get('/api/books/?search=Book&facets=genre,book_type,published_year_decade')
+        assert response.status_code == status.HTTP_200_OK
+        facets = response.data['facets']
+        expected = Book.objects.filter(title__icontains='book')
+        genre_counts = {f['value']: f['count'] for f in facets['genre']}
+        assert genre_counts['fantasy'] == expected.filter(genre='fantasy').count()
+        assert {'value': 'fantasy', 'label': 'Fantasy', 'count': genre_counts['fantasy']} in facets['genre']
+        type_counts = {f['value']: f['count'] for f in facets['book_type']}
+        assert type_counts['short_stories'] == expected.filter(book_type='short_stories').count()
+        decades = {f['value']: f for f in facets['published_year_decade']}
+        assert decades[2010]['count'] == expected.filter(published_year__range=(2010, 2019)).count()
+        assert decades[2020]['label'] == '2020s'
+
+    def test_facets_follow_filters(self, api_client, multiple_books):
+        """Facet counts are restricted by the active filters"""
+        response = api_client.get('/api/books/?genre=fantasy&facets=genre')
+        assert [f['value'] for f in response.data['facets']['genre']] == ['fantasy']
+
+    def test_unknown_facet_is_rejected(self, api_client):
+        """Unknown facet names return 400"""
+        response = api_client.get('/api/books/?facets=colour')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_facets_are_cached_with_the_page(self, api_client, multiple_books, django_assert_num_queries):
+        """Facet results are served from the response cache"""
+        first = api_client.get('/api/books/?facets=genre')
+        with django_assert_num_queries(0):
+            second = api_client.get('/api/books/?facets=genre')
+        assert second.data['facets'] == first.data['facets']
+
+
+class TestSparseFieldsets:
+    """Tests for ?fields= / ?exclude= on the book endpoints"""
+
+    def test_list_returns_only_requested_fields(self, api_client, multiple_books):
+        """?fields= narrows every list item"""
+        response = api_client.get('/api/books/?fields=id,title,author,cover_image')
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(b) == {'id', 'title', 'author', 'cover_image'} for b in response.data['results'])
+
+    def test_list_selects_only_requested_columns(self, api_client, multiple_books, django_assert_max_num_queries):
+        """Columns left out of ?fields= are not read from the database"""
+        with django_assert_max_num_queries(5) as captured:
+            api_client.get('/api/books/?fields=id,title')
+        page_query = captured.captured_queries[-1]['sql']
+        assert '"books_book"."title"' in page_query
+        assert '"books_book"."description"' not in page_query
+
+    def test_list_exclude_drops_fields(self, api_client, multiple_books):
+        """?exclude= removes fields from the output"""
+        response = api_client.get('/api/books/?exclude=description,created_at')
+        item = response.data['results'][0]
+        assert 'description' not in item and 'created_at' not in item
+        assert 'title' in item
+
+    def test_cursor_pagination_works_with_sparse_fields(self, api_client, multiple_books):
+        """Cursor links still work when the sort key is not in ?fields="""
+        first = api_client.get('/api/books/?pagination=cursor&page_size=2&fields=id&ordering=-published_year')
+        second = api_client.get(first.data['next'])
+        ids = [b['id'] for b in first.data['results'] + second.data['results']]
+        expected = sorted(Book.objects.all(), key=lambda b: (b.published_year is None, -(b.published_year or 0), -b.id))
+        assert ids == [b.id for b in expected][:4]
+        assert set(second.data['results'][0]) == {'id'}
+
+    def test_detail_returns_only_requested_fields(self, api_client, book, django_assert_max_num_queries):
+        """?fields= narrows the detail response and its query"""
+        with django_assert_max_num_queries(5) as captured:
+            response = api_client.get(f'/api/books/{book.id}/?fields=title,published_year')
+        assert response.data == {'title': 'Test Book', 'published_year': 2020}
+        assert '"books_book"."description"' not in captured.captured_queries[-1]['sql']
+
+    def test_unknown_field_is_rejected(self, api_client, book):
+        """Unknown field names return 400"""
+        response = api_client.get(f'/api/books/{book.id}/?fields=title,colour')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'fields' in response.data['error']['details']
+
+    def test_writes_ignore_fieldsets(self, authenticated_client, book):
+        """Updates validate and return every field"""
+        response = authenticated_client.patch(f'/api/books/{book.id}/?fields=id', {'title': 'Renamed'})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['title'] == 'Renamed'
+        assert 'description' in response.data
@@ -6,6 +6,10 @@ urlpatterns = [
     path('<int:pk>/', views.BookDetailAPIView.as_view(), name='book-detail'),
     path('<int:book_id>/notes/', views.BookNotesListAPIView.as_view(), name='book-notes-list'),
     path('notes/<int:pk>/', views.BookNoteDetailAPIView.as_view(), name='book-note-detail'),
+    path('bulk/', views.BookBulkAPIView.as_view(), name='book-bulk'),
+    path('export/', views.BookExportAPIView.as_view(), name='book-export'),
     path('choices/', views.BookChoicesAPIView.as_view(), name='book-choices'),
+    path('cache-stats/', views.BookListCacheStatsAPIView.as_view(), name='book-list-cache-stats'),
+    path('suggest/', views.BookSuggestAPIView.as_view(), name='book-suggest'),
 ]
 
@@ -1,15 +1,33 @@
-from django.http import HttpResponse
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import generics, status
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError
 from .models import Book, UserNote
-from .serializers import BookSerializer, UserNoteSerializer
-from .pagination import BookPageNumberPagination
+from .serializers import BookSerializer, FastListRepresentation, UserNoteSerializer
+from .pagination import BookPageNumberPagination, BookKeysetPagination
 from .helpers import format_choices
+from .filters import BookSearchFilter, BookOrderingFilter
+from .suggest import suggest_index
+from .signals import catalog_bulk_changed
+from .export import EXPORT_FIELDS, iter_export_records
+from .renderers import CSVRenderer, NDJSONRenderer
+from .facets import compute_facets, get_requested_facets
+from .fieldsets import SparseFieldsetMixin
+from . import conditional
+from .cache import (
+    book_list_cache_key,
+    get_book_list_cache_stats,
+    get_cached_book_list,
+    set_cached_book_list,
+)
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from book_explorer.db.routing import ReplicaRoutingMixin
 
 
 def home(request):
@@ -35,14 +53,20 @@ def home(request):
     return HttpResponse(html_content)
 
 
-class BookListCreateAPIView(generics.ListCreateAPIView):
+@method_decorator(
+    condition(etag_func=conditional.book_list_etag, last_modified_func=conditional.book_list_last_modified),
+    name='get',
+)
+class BookListCreateAPIView(ReplicaRoutingMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
+    read_from_replica = True
     queryset = Book.objects.all()
     serializer_class = BookSerializer
     pagination_class = BookPageNumberPagination
+    keyset_pagination_class = BookKeysetPagination
     filter_backends = [
         DjangoFilterBackend,
-        SearchFilter,
-        OrderingFilter,
+        BookSearchFilter,
+        BookOrderingFilter,
     ]
     search_fields = ["title", "author"]
     filterset_fields = ["genre", "book_type"]
@@ -57,17 +81,69 @@ class BookListCreateAPIView(generics.ListCreateAPIView):
             return [IsAuthenticated()]
         return [AllowAny()]
 
-    def get_queryset(self):
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when the client opts in with ?pagination=cursor
+        (or follows a cursor link), page numbers otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.method == 'GET' and self.keyset_pagination_class.is_requested(self.request):
+                self._paginator = self.keyset_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve anonymous list requests from the response cache. Entries are
+        keyed by the normalized query and the catalog version, so any book
+        change invalidates them.
+        """
+        if request.user.is_authenticated:
+            return self.list_with_facets(request, *args, **kwargs)
+
+        key = book_list_cache_key(request, self.paginator.get_page_size(request))
+        data = get_cached_book_list(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = self.list_with_facets(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            set_cached_book_list(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list_with_facets(self, request, *args, **kwargs):
         """
-        Optimize query for list view by excluding description field.
-        Description is only needed in detail view.
+        The paginated list, read with .values() and rendered through
+        FastListRepresentation, plus per-value counts for the current filters
+        and search when ?facets= is given.
         """
-        if self.request.method == 'GET' and 'pk' not in self.kwargs:
-            return Book.objects.all().defer('description')
-        return Book.objects.all()
+        facets = get_requested_facets(request)
+        queryset = self.filter_queryset(self.get_queryset())
+
+        representation = FastListRepresentation(self.get_serializer_class(), self.get_serializer_context())
+        # Keyset cursors read the sort keys (including annotations such as
+        # search_rank) from the rows, even when ?fields= leaves them out.
+        ordering = [name.lstrip('-') for name in queryset.query.order_by if isinstance(name, str) and name != '?']
+        columns = dict.fromkeys([*representation.sources, 'id', *ordering, *queryset.query.annotations])
+        page = self.paginate_queryset(queryset.values(*columns))
+        response = self.get_paginated_response(representation.to_representation(page))
+
+        if facets:
+            response.data['facets'] = compute_facets(queryset, facets)
+        return response
 
 
-class BookDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+@method_decorator(
+    condition(etag_func=conditional.book_detail_etag, last_modified_func=conditional.book_detail_last_modified),
+    name='get',
+)
+class BookDetailAPIView(ReplicaRoutingMixin, SparseFieldsetMixin, generics.RetrieveUpdateDestroyAPIView):
+    read_from_replica = True
     queryset = Book.objects.all()
     serializer_class = BookSerializer
 
@@ -80,6 +156,126 @@ class BookDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         return [IsAuthenticated()]
 
 
+class BookBulkAPIView(ReplicaRoutingMixin, APIView):
+    """
+    Apply a list of create/update/delete operations in one transaction, e.g.:
+    [
+        { "op": "create", "data": { "title": "...", "author": "..." } },
+        { "op": "update", "id": 3, "data": { "published_year": 2001 } },
+        { "op": "delete", "id": 4 }
+    ]
+    Returns one result per operation, in order. If any operation is invalid,
+    nothing is written and the errors are returned per operation.
+    """
+    permission_classes = [IsAuthenticated]
+    operations = ('create', 'update', 'delete')
+
+    def post(self, request):
+        operations = request.data
+        if not isinstance(operations, list):
+            raise ValidationError({'non_field_errors': ['Expected a list of operations.']})
+        if len(operations) > settings.BOOK_BULK_MAX_OPERATIONS:
+            raise ValidationError({'non_field_errors': [
+                f'At most {settings.BOOK_BULK_MAX_OPERATIONS} operations are allowed per request.'
+            ]})
+
+        errors = [self.check_operation(operation) for operation in operations]
+        by_op = {op: [] for op in self.operations}
+        for index, operation in enumerate(operations):
+            if not errors[index]:
+                by_op[operation['op']].append(index)
+
+        ids = [operations[index]['id'] for index in by_op['update'] + by_op['delete']]
+        existing = Book.objects.in_bulk(ids)
+        seen = set()
+        for index in by_op['update'] + by_op['delete']:
+            book_id = operations[index]['id']
+            if book_id not in existing:
+                errors[index] = {'id': ['Book not found.']}
+            elif book_id in seen:
+                errors[index] = {'id': ['Each book can only appear in one update or delete operation.']}
+            seen.add(book_id)
+        by_op['update'] = [index for index in by_op['update'] if not errors[index]]
+        by_op['delete'] = [index for index in by_op['delete'] if not errors[index]]
+
+        create_serializer = BookSerializer(data=[operations[i]['data'] for i in by_op['create']], many=True)
+        update_serializer = BookSerializer(
+            [existing[operations[i]['id']] for i in by_op['update']],
+            data=[operations[i]['data'] for i in by_op['update']],
+            many=True,
+            partial=True,
+        )
+        for serializer, indexes in ((create_serializer, by_op['create']), (update_serializer, by_op['update'])):
+            if not serializer.is_valid():
+                for index, item_errors in zip(indexes, serializer.errors):
+                    errors[index] = item_errors
+
+        if any(errors):
+            raise ValidationError({'operations': errors})
+
+        with transaction.atomic():
+            created = create_serializer.save() if by_op['create'] else []
+            if by_op['update']:
+                update_serializer.save()
+            delete_ids = [operations[i]['id'] for i in by_op['delete']]
+            if delete_ids:
+                Book.objects.filter(id__in=delete_ids).delete()
+            catalog_bulk_changed.send(sender=Book)
+
+        results = [None] * len(operations)
+        for index, book in zip(by_op['create'], created):
+            results[index] = {'op': 'create', 'id': book.id, 'status': 'created'}
+        for index in by_op['update']:
+            results[index] = {'op': 'update', 'id': operations[index]['id'], 'status': 'updated'}
+        for index in by_op['delete']:
+            results[index] = {'op': 'delete', 'id': operations[index]['id'], 'status': 'deleted'}
+        return Response({'results': results})
+
+    def check_operation(self, operation):
+        """Return structural errors for a single operation (empty if valid)."""
+        if not isinstance(operation, dict) or operation.get('op') not in self.operations:
+            return {'op': [f'Must be one of: {", ".join(self.operations)}.']}
+        if operation['op'] in ('update', 'delete'):
+            book_id = operation.get('id')
+            if not isinstance(book_id, int) or isinstance(book_id, bool):
+                return {'id': ['A valid integer is required.']}
+        if operation['op'] in ('create', 'update') and not isinstance(operation.get('data'), dict):
+            return {'data': ['Expected an object with book fields.']}
+        return {}
+
+
+class BookExportAPIView(generics.GenericAPIView):
+    """
+    Stream the whole (optionally filtered) catalog as NDJSON (default) or CSV,
+    e.g. GET /api/books/export/?format=csv&genre=fiction
+    Accepts the same filter and search parameters as the list endpoint.
+    """
+    queryset = Book.objects.all()
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+    pagination_class = None
+    filter_backends = [
+        DjangoFilterBackend,
+        BookSearchFilter,
+        BookOrderingFilter,
+    ]
+    search_fields = ["title", "author"]
+    filterset_fields = ["genre", "book_type"]
+    ordering_fields = ["title", "author", "published_year", "created_at"]
+    ordering = ["id"]
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        renderer = request.accepted_renderer
+        records = iter_export_records(queryset, request, settings.BOOK_EXPORT_CHUNK_SIZE)
+        response = StreamingHttpResponse(
+            renderer.stream(EXPORT_FIELDS, records),
+            content_type=f'{renderer.media_type}; charset={renderer.charset}',
+        )
+        response['Content-Disposition'] = f'attachment; filename="books.{renderer.format}"'
+        return response
+
+
+@method_decorator(condition(etag_func=conditional.choices_etag), name='get')
 class BookChoicesAPIView(APIView):
     """
     Returns both genre and book_type choices in one call, e.g.:
@@ -100,7 +296,41 @@ class BookChoicesAPIView(APIView):
         )
 
 
-class BookNotesListAPIView(generics.ListCreateAPIView):
+class BookListCacheStatsAPIView(APIView):
+    """
+    Hit/miss counters of the anonymous book list response cache (admin only).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_book_list_cache_stats())
+
+
+class BookSuggestAPIView(APIView):
+    """
+    Typeahead completions for the search box, e.g. GET /api/books/suggest/?q=har
+    {
+        "results": [{ "value": "Harlan Coben", "field": "author" }]
+    }
+    Served from the in-memory prefix index, without touching the database.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    default_limit = 10
+    max_limit = 25
+
+    def get(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', self.default_limit)), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+        suggestions = suggest_index.suggest(request.query_params.get('q', ''), limit=max(limit, 1))
+        return Response(
+            {"results": [{"value": value, "field": field} for field, value in suggestions]}
+        )
+
+
+class BookNotesListAPIView(ReplicaRoutingMixin, SparseFieldsetMixin, generics.ListCreateAPIView):
     """
     List all user's notes for a book, or create a new note.
     GET: Returns list of all user's notes for the book
@@ -122,7 +352,7 @@ class BookNotesListAPIView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user, book_id=book_id)
 
 
-class BookNoteDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class BookNoteDetailAPIView(ReplicaRoutingMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update, or delete a specific note.
     """
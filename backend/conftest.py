@@ -0,0 +1,10 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test from an empty cache so cached responses and counts never leak between tests"""
+    cache.clear()
+    yield
+    cache.clear()
@@ -6,8 +6,10 @@ export interface Book {
   book_type: string | null;
   published_year: number | null;
   cover_image?: string;
+  cover_renditions?: Record<string, { jpeg: string; webp: string }>;
   description?: string;
   created_at?: string;
+  updated_at?: string;
 }
 
 export interface DropdownOption {
@@ -8,13 +8,18 @@ interface CardProps {
 }
 
 export const Card: React.FC<CardProps> = ({ book, onClick }) => {
+    const thumbnail = book.cover_renditions?.["320"];
     return (
         <div onClick={onClick} className="bg-card cursor-pointer rounded-xl p-4 shadow-md transition-all hover:-translate-y-1 hover:shadow-lg">
-            <img
-                src={book.cover_image ? book.cover_image : PlaceholderImage}
-                alt={book.title}
-                className="mb-4 h-48 w-full rounded-lg object-cover"
-            />
+            <picture>
+                {thumbnail && <source srcSet={thumbnail.webp} type="image/webp" />}
+                <img
+                    src={thumbnail?.jpeg ?? (book.cover_image ? book.cover_image : PlaceholderImage)}
+                    alt={book.title}
+                    loading="lazy"
+                    className="mb-4 h-48 w-full rounded-lg object-cover"
+                />
+            </picture>
             <h2 className="border-t border-secondary/20 pt-4 text-lg font-semibold text-secondary truncate">
                 {book.title}
             </h2>